@@ -0,0 +1,34 @@
+import os
+import random
+import time
+
+from utility.adaptive_trials import AdaptiveRun
+from utility.constants import (
+    ADAPTIVE_CONFIDENCE,
+    ADAPTIVE_HALF_WIDTHS,
+    ADAPTIVE_MAX_TRIALS,
+    ADAPTIVE_MIN_TRIALS,
+    ADAPTIVE_ROUND_TRIALS,
+    ADAPTIVE_STRATEGIES,
+    MASTER_SEED,
+    RESULTS_DIR,
+)
+
+# Main execution
+if __name__ == "__main__":
+    start_time = time.time()
+    master_seed = MASTER_SEED if MASTER_SEED is not None else random.randrange(2**32)
+    print(f"Master seed: {master_seed}")
+
+    # Draft until every draft slot's statistics are known to the requested width
+    run = AdaptiveRun(ADAPTIVE_STRATEGIES, ADAPTIVE_HALF_WIDTHS, master_seed, confidence=ADAPTIVE_CONFIDENCE,
+                      round_trials=ADAPTIVE_ROUND_TRIALS, min_trials=ADAPTIVE_MIN_TRIALS,
+                      max_trials=ADAPTIVE_MAX_TRIALS)
+    summary_df = run.run()
+    status = "converged" if run.converged() else "stopped at ADAPTIVE_MAX_TRIALS"
+    print(f"{status} after {run.trials} trials per strategy in {run.rounds} rounds")
+
+    summary_file = os.path.join(RESULTS_DIR, "adaptive_summary.csv")
+    summary_df.to_csv(summary_file, index=False)
+    print(f"Draft slot summary saved to {summary_file}")
+    print(f"Elapsed time: {time.time() - start_time:.2f} seconds")
@@ -0,0 +1,32 @@
+import argparse
+import json
+import sys
+
+from utility.benchmark import compare, latest_report, run_in_fixture, write_report
+from utility.constants import BENCHMARK_DIR, BENCHMARK_REPEATS, REGRESSION_TOLERANCE
+
+# Main execution
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time the simulator, ranking, env and scrapers on synthetic data.")
+    parser.add_argument("--baseline", help="report to compare against (default: the latest in BENCHMARK_DIR)")
+    parser.add_argument("--quick", action="store_true", help="smaller workloads for a fast smoke run")
+    args = parser.parse_args()
+
+    # Pick the baseline before this run's report lands in the same folder
+    baseline_path = args.baseline or latest_report(BENCHMARK_DIR)
+    baseline = None
+    if baseline_path:
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+
+    if args.quick:
+        report = run_in_fixture(num_drafts=40, env_steps=1000, num_plays=10000, repeats=BENCHMARK_REPEATS)
+    else:
+        report = run_in_fixture(repeats=BENCHMARK_REPEATS)
+    report_path = write_report(report, BENCHMARK_DIR)
+    print(f"Benchmark report saved to {report_path}" + (f", compared with {baseline_path}" if baseline else ""))
+
+    regressions = compare(report, baseline, REGRESSION_TOLERANCE)
+    if regressions:
+        print(f"Regressions beyond {REGRESSION_TOLERANCE:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
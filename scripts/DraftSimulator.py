@@ -1,150 +1,124 @@
 import os
-import pandas as pd
-import random
+import numpy as np
 import time
-from pathlib import Path
-import re
-from typing import Dict, List
+from contextlib import ExitStack
 from utility.constants import *
+from utility.batch_engine import batched_units
+from utility.checkpoint import Campaign
+from utility.draft_engine import DraftBoard, run_draft
+from utility.parallel_runner import run_trials
+from utility.player_ids import load_registry
+from utility.player_pool import available_years, load_player_pool
+from utility import profiler
+from utility.profiler import phase
+from utility.results_sink import ResultsSink, export_csv
+from utility.lineup_scoring import season_waiver_points
+from utility.standings import DraftStandings
 
 
-# Utility: Load files
-def load_file(folder, filename):
-    file_path = os.path.join(folder, filename)
-    if os.path.exists(file_path):
-        return pd.read_csv(file_path)
-    raise FileNotFoundError(f"File {filename} not found in folder {folder}")
-
-def extract_years(folder_path: Path) -> List[int]:
-    """Extract years from CSV file names."""
-    years = [int(re.match(r"^\d{4}", file.name).group()) 
-                for file in folder_path.glob("*.csv") if re.match(r"^\d{4}", file.name)]
-    return sorted(years)
-
-# Load ADP file
-def load_adp_file():
-    year = random.choice(extract_years(ADP_DIR))
-    file_name = f"{year}ADP.csv"
-    adp_df = load_file(ADP_DIR, file_name)
-    adp_df['year'] = year   
-    return adp_df
-
-# Load stats
-def load_seasonal_stats(year):
-    return load_file(SEASONAL_STATS_DIR, f"player_stats_{year}.csv")
-
-def load_defensive_stats(year):
-    return load_file(DEFENSIVE_STATS_DIR, f"seasonal_defensive_stats_{year}.csv")
-
-# Merge stats into ADP
-def merge_stats(adp_df, seasonal_stats_df, defensive_stats_df):
-    adp_df = adp_df.merge(
-        seasonal_stats_df[["player_id", "fppr"]], on="player_id", how="left"
-    )
-    defensive_stats_df = defensive_stats_df.rename(columns={"pa_team": "player_id", "fpts": "def_fpts"})
-    adp_df = adp_df.merge(
-        defensive_stats_df[["player_id", "def_fpts"]], on="player_id", how="left"
-    )
-    adp_df["fpts"] = adp_df.apply(
-        lambda row: row["def_fpts"] if row["POSITION"] == "DST" else row["fppr"], axis=1
-    )
-    return adp_df
-
-# Select player with weighted probabilities
-def select_player_with_weights(players, weights):
-    """
-    Randomly select a player based on weighted probabilities.
-    """
-    return random.choices(players.to_dict("records"), weights=weights[:len(players)], k=1)[0]
-
 # Simulate draft
-def simulate_draft(trial_number):
-    # Load data
-    adp_df = load_adp_file()
-    year = adp_df['year'].iloc[0]
-    seasonal_stats_df = load_seasonal_stats(year)
-    defensive_stats_df = load_defensive_stats(year)
-    data_df = merge_stats(adp_df, seasonal_stats_df, defensive_stats_df)
-
-    # Sort players by FPPRAVG
-    data_df = data_df.sort_values(by="FPPRAVG").reset_index(drop=True)
-    
-    # Initialize draft setup
-    draft_order = list(range(1, NUM_MANAGERS + 1))
-    random.shuffle(draft_order)
-    results = []
-    pick_order = 1
-
-    # Track positions
-    required_positions = {f"Team_{i}": STARTER_POSITIONS.copy() for i in range(1, NUM_MANAGERS + 1)}
-    team_counts = {f"Team_{i}": STARTER_POSITIONS.copy() for i in range(1, NUM_MANAGERS + 1)}
-
-    # Simulate rounds
-    for round_num in range(1, NUM_ROUNDS + 1):
-        current_order = draft_order if round_num % 2 != 0 else draft_order[::-1]
-
-        for manager in current_order:
-            team_name = f"Team_{manager}"
-
-            # Special rule for Team_1 in rounds 1–3
-            if team_name == "Team_1" and round_num <= 3:
-                available_rbs = data_df[data_df["POSITION"] == "RB"]
-                selected_player = available_rbs.iloc[0] if not available_rbs.empty else data_df.iloc[0]
-            else:
-                # Select player based on position constraints
-                unmet_positions = [pos for pos, count in required_positions[team_name].items() if count > 0]
-                available_players = data_df[
-                    data_df["POSITION"].apply(lambda pos: team_counts[team_name][pos] < POSITION_LIMITS[pos])
-                ]
-                if unmet_positions:
-                    available_players = available_players[available_players["POSITION"].isin(unmet_positions)]
-
-                # Weighted selection
-                if round_num <= 3:
-                    top_players = available_players.head(5)
-                    selected_player = select_player_with_weights(top_players, ROUND_1_3_WEIGHTS)
-                else:
-                    top_players = available_players.head(6)
-                    selected_player = select_player_with_weights(top_players, ROUND_4_16_WEIGHTS)
-
-            # Update position counts
-            position = selected_player["POSITION"]
-            team_counts[team_name][position] += 1
-            if required_positions[team_name][position] > 0:
-                required_positions[team_name][position] -= 1
-
-            # Record pick
-            results.append({
-                "trial_number": trial_number,
-                "round": round_num,
-                "overall_pick": pick_order,
-                "team_name": team_name,
-                "player_name": selected_player["player_name"],
-                "player_id": selected_player["player_id"],
-                "position": position,
-                "fpts": selected_player["fpts"],
-                "year": year
-            })
-
-            pick_order += 1
-            data_df = data_df[data_df["player_id"] != selected_player["player_id"]].reset_index(drop=True)  # Round FFPRAVG to 2 decimal
-            data_df["fpts"] = data_df["fpts"].round(2)
-    return results
+def simulate_draft(trial_number, rng: np.random.Generator):
+    # Load the season's merged pool, already sorted by FPPRAVG
+    year = int(rng.choice(available_years()))
+    with phase("load_pool"):
+        data_df = load_player_pool(year)
+
+    # Run the draft on the array-backed board
+    with phase("board_build"):
+        board = DraftBoard(data_df)
+    with phase("run_draft"):
+        return run_draft(board, trial_number, year, rng)
+
+# Simulate draft and keep live standings
+def simulate_draft_with_standings(trial_number, rng: np.random.Generator):
+    year = int(rng.choice(available_years()))
+    with phase("load_pool"):
+        data_df = load_player_pool(year)
+    with phase("board_build"):
+        board = DraftBoard(data_df)
+    standings = DraftStandings(trial_number, year)
+    with phase("run_draft"):
+        draft_results = run_draft(board, trial_number, year, rng, standings)
+    with phase("standings"):
+        fantasy_ranking = standings.final_ranking(season_waiver_points(year))
+    return {
+        "draft_results": draft_results,
+        "round_standings": standings.round_standings,
+        "fantasy_ranking": fantasy_ranking,
+    }
+
+# Settings a resumed run must share with the run it continues
+def campaign_settings(tables):
+    return {
+        "trials": NUMBER_OF_TRIALS,
+        "mode": SIMULATION_MODE,
+        "unit_size": BATCH_SIZE if SIMULATION_MODE == "batched" else TRIAL_CHUNK_SIZE,
+        "tables": tables,
+        "results_chunk_size": RESULTS_CHUNK_SIZE,
+        "bot_profiles": BOT_PROFILES,
+        "manager_profiles": MANAGER_PROFILES,
+        "default_bot_profile": DEFAULT_BOT_PROFILE,
+    }
 
 # Main execution
 if __name__ == "__main__":
     start_time = time.time()
-
-    all_results = []
-    for trial in range(1, NUMBER_OF_TRIALS + 1):
-        all_results.extend(simulate_draft(trial))
-
-    # Save results
-    os.makedirs(RESULTS_DIR, exist_ok=True)
-    results_df = pd.DataFrame(all_results)
-    output_file = os.path.join(RESULTS_DIR, "draft_results.csv")
-    results_df.to_csv(output_file, index=False)
-    print(f"Draft results saved to {output_file}")
+    if PROFILE_PHASES:
+        profiler.enable(PROFILE_MEMORY, PROFILE_TARGET, PROFILE_TARGET_MODE)
+
+    # Resume an unfinished run with the same settings and data, else start a new one
+    trials = range(1, NUMBER_OF_TRIALS + 1)
+    tables = ["draft_results"]
+    if SIMULATION_MODE != "batched" and TRACK_STANDINGS:
+        tables += ["round_standings", "fantasy_ranking"]
+    campaign = Campaign(RESULTS_DIR, campaign_settings(tables), MASTER_SEED, CHECKPOINT_SECONDS,
+                        resume=RESUME_CAMPAIGNS)
+    master_seed = campaign.master_seed
+    print(f"Master seed: {master_seed}")
+    if campaign.resumed:
+        print(f"Resuming after trial {campaign.trials_done} of {NUMBER_OF_TRIALS}")
+
+    # Results store int player codes; the side table maps them back to player ids
+    load_registry().write_lookup()
+
+    # Stream results to Parquet parts as trials finish, checkpointing between units
+    results_dir = os.path.join(RESULTS_DIR, "draft_results")
+    with ExitStack() as stack:
+        sinks = {table: stack.enter_context(ResultsSink(os.path.join(RESULTS_DIR, table),
+                                                        resume=campaign.sink_state(table)))
+                 for table in tables}
+        unit, trials_done = campaign.units_done, campaign.trials_done
+        if SIMULATION_MODE == "batched":
+            for results_df, rng_state in batched_units(trials, master_seed, BATCH_SIZE, unit, campaign.rng_state):
+                with phase("write_results"):
+                    sinks["draft_results"].write_frame(results_df)
+                unit, trials_done = unit + 1, trials_done + results_df["trial_number"].nunique()
+                campaign.commit(unit, trials_done, sinks, rng_state)
+        else:
+            simulate = simulate_draft_with_standings if TRACK_STANDINGS else simulate_draft
+            for chunk_results in run_trials(simulate, trials[trials_done:], master_seed,
+                                            workers=NUM_WORKERS, chunk_size=TRIAL_CHUNK_SIZE):
+                with phase("write_results"):
+                    if isinstance(chunk_results, dict):
+                        for table, records in chunk_results.items():
+                            sinks[table].write_records(records)
+                    else:
+                        sinks["draft_results"].write_records(chunk_results)
+                unit, trials_done = unit + 1, min(trials_done + TRIAL_CHUNK_SIZE, NUMBER_OF_TRIALS)
+                campaign.commit(unit, trials_done, sinks)
+        campaign.finish(sinks)
+    if TRACK_STANDINGS and SIMULATION_MODE != "batched":
+        print(f"Round standings and final ranking saved to {RESULTS_DIR}")
+    print(f"Draft results saved to {results_dir} ({sinks['draft_results'].rows_written} rows)")
+
+    if EXPORT_CSV:
+        output_file = os.path.join(RESULTS_DIR, "draft_results.csv")
+        export_csv(results_dir, output_file)
+        print(f"Draft results exported to {output_file}")
 
     end_time = time.time()
-    print(f"Elapsed time: {end_time - start_time:.2f} seconds")
\ No newline at end of file
+    print(f"Elapsed time: {end_time - start_time:.2f} seconds")
+
+    if profiler.is_enabled():
+        profile_file = profiler.write_report(os.path.join(RESULTS_DIR, "profile_draft_simulator.json"))
+        print(f"Phase profile saved to {profile_file}")
\ No newline at end of file
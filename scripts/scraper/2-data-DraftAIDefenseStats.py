@@ -3,11 +3,12 @@ from pathlib import Path
 root_dir = Path(__file__).parent.parent
 sys.path.append(str(root_dir))
 
-import nfl_data_py as nfl
 import pandas as pd
 import os
 
 from utility.constants import *
+from utility.pbp_store import DEFENSE_COLUMNS, load_pbp
+from utility.scoring import PA_BINS, PA_LABELS, YA_BINS, YA_LABELS, bucket_indicators, score_dst
 
 
 # Create a folder to save defensive stats
@@ -15,9 +16,9 @@ if not os.path.exists(DEFENSIVE_STATS_DIR):
     print("Defensive Stats Directory Created.")
     os.makedirs(DEFENSIVE_STATS_DIR)
 
-def calculate_seasonal_defensive_stats_with_points_allowed_and_buckets(year):
-    # Load play-by-play data for the given year
-    pbp_data = nfl.import_pbp_data([year])
+def calculate_seasonal_defensive_stats_with_points_allowed_and_buckets(year, pbp_dir=PBP_DIR):
+    # Load play-by-play data for the given year from the local store
+    pbp_data = load_pbp(year, columns=DEFENSE_COLUMNS, directory=pbp_dir)
 
     # Filter data to include only Weeks 1 through 14
     pbp_data = pbp_data[(pbp_data['week'] >= 1) & (pbp_data['week'] <= 14)]
@@ -116,49 +117,15 @@ def calculate_seasonal_defensive_stats_with_points_allowed_and_buckets(year):
     # Fill NaN values with 0 (in case no fumble TDs, interception TDs, or blocked kicks occurred)
     weekly_defensive_stats['blkk'].fillna(0, inplace=True)
 
-    # Create yardage bucket indicator columns
-    ya_bins = [0, 99, 199, 299, 349, 399, 449, 499, 549, float('inf')]
-    ya_labels = ['YA100', 'YA199', 'YA299', 'YA349', 'YA399', 'YA449', 'YA499', 'YA549', 'YA550']
-    weekly_defensive_stats['ya_bucket'] = pd.cut(weekly_defensive_stats['ya'], bins=ya_bins, labels=ya_labels, right=True)
-    for label in ya_labels:
-        weekly_defensive_stats[label] = (weekly_defensive_stats['ya_bucket'] == label).astype(int)
-    weekly_defensive_stats.drop(columns=['ya_bucket'], inplace=True)
-
-    # Create points allowed (PA) bucket indicator columns
-    pa_bins = [-0.01, 0.99, 6.99, 13.99, 17.99, 27.99, 34.99, 45.99, float('inf')]
-    pa_labels = ['PA0', 'PA1', 'PA7', 'PA14', 'PA18', 'PA28', 'PA35', 'PA46']
-    weekly_defensive_stats['pa_bucket'] = pd.cut(weekly_defensive_stats['pa'], bins=pa_bins, labels=pa_labels, right=True)
-    for label in pa_labels:
-        weekly_defensive_stats[label] = (weekly_defensive_stats['pa_bucket'] == label).astype(int)
-    weekly_defensive_stats.drop(columns=['pa_bucket'], inplace=True)
+    # Create yardage and points allowed (PA) bucket indicator columns
+    weekly_defensive_stats = pd.concat([
+        weekly_defensive_stats,
+        bucket_indicators(weekly_defensive_stats['ya'], YA_BINS, YA_LABELS),
+        bucket_indicators(weekly_defensive_stats['pa'], PA_BINS, PA_LABELS),
+    ], axis=1)
 
     # Calculating fantasy points (weekly)
-    weekly_defensive_stats['fpts'] = (
-        6 * weekly_defensive_stats['d_td'] +
-        1 * weekly_defensive_stats['sk'] +
-        2 * weekly_defensive_stats['pbk'] +
-        2 * weekly_defensive_stats['blkk'] +
-        2 * weekly_defensive_stats['int'] +
-        2 * weekly_defensive_stats['fr'] +
-        2 * weekly_defensive_stats['sfty'] +
-        5 * weekly_defensive_stats['PA0'] +
-        4 * weekly_defensive_stats['PA1'] +
-        3 * weekly_defensive_stats['PA7'] +
-        1 * weekly_defensive_stats['PA14'] +
-        0 * weekly_defensive_stats['PA18'] -
-        1 * weekly_defensive_stats['PA28'] -
-        3 * weekly_defensive_stats['PA35'] -
-        5 * weekly_defensive_stats['PA46'] +
-        5 * weekly_defensive_stats['YA100'] +
-        3 * weekly_defensive_stats['YA199'] +
-        2 * weekly_defensive_stats['YA299'] +
-        0 * weekly_defensive_stats['YA349'] -
-        1 * weekly_defensive_stats['YA399'] -
-        3 * weekly_defensive_stats['YA449'] -
-        5 * weekly_defensive_stats['YA499'] -
-        6 * weekly_defensive_stats['YA549'] -
-        7 * weekly_defensive_stats['YA550']
-    )
+    weekly_defensive_stats['fpts'] = score_dst(weekly_defensive_stats)['fpts']
     
     # Sum weekly bucket indicators across the season
     seasonal_defensive_stats = weekly_defensive_stats.groupby(['season', 'pa_team']).agg(
@@ -170,8 +137,8 @@ def calculate_seasonal_defensive_stats_with_points_allowed_and_buckets(year):
         pbk=('pbk', 'sum'),
         blkk=('blkk', 'sum'),
         fpts=('fpts', 'sum'),
-        **{label: (label, 'sum') for label in ya_labels},  # Sum YA buckets
-        **{label: (label, 'sum') for label in pa_labels}   # Sum PA buckets
+        **{label: (label, 'sum') for label in YA_LABELS},  # Sum YA buckets
+        **{label: (label, 'sum') for label in PA_LABELS}   # Sum PA buckets
     ).reset_index()
 
     # Calculating fantasy points
@@ -185,5 +152,6 @@ def calculate_seasonal_defensive_stats_with_points_allowed_and_buckets(year):
     print(f"Seasonal defensive stats for {year} saved to '{seasonal_file_path}'")
 
 # Process data for each season from 2018 to 2024
-for year in range(YEAR_BEGINNING, YEAR_END):
-    calculate_seasonal_defensive_stats_with_points_allowed_and_buckets(year)
+if __name__ == "__main__":
+    for year in range(YEAR_BEGINNING, YEAR_END):
+        calculate_seasonal_defensive_stats_with_points_allowed_and_buckets(year)
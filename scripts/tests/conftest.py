@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Tests import the utility package the way the entry scripts do, from scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
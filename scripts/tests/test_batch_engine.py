@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from utility.batch_engine import LOOKAHEAD, BatchBoard, _first_k
+from utility.constants import POSITIONS
+from utility.draft_engine import DraftBoard
+from utility.player_pool import available_years, load_player_pool
+
+CASES = 300
+
+
+def random_state(batch, rng, num_trials):
+    """Availability, eligibility and valid cursors of ``num_trials`` mid-draft boards.
+
+    Drafts take mostly from the top of the board, so position lists have
+    drafted heads and the lookahead windows regularly run dry.
+    """
+    rank = np.arange(batch.size)
+    drafted = (rank < rng.integers(0, 200, size=(num_trials, 1))) | (rng.random((num_trials, batch.size)) < 0.3)
+    available = np.zeros((num_trials, batch.size + 1), dtype=bool)
+    available[:, :batch.size] = ~drafted
+    eligible = rng.random((num_trials, len(POSITIONS))) < 0.6
+
+    # A cursor may sit anywhere up to the first available player of its position
+    cursors = np.zeros((num_trials, len(POSITIONS)), dtype=np.intp)
+    for code, indices in enumerate(batch.board.by_position):
+        head = np.argmax(np.c_[available[:, indices], np.ones(num_trials, dtype=bool)], axis=1)
+        cursors[:, code] = rng.integers(0, head + 1)
+    return available, eligible, cursors
+
+
+@pytest.mark.parametrize("lookahead", [2, LOOKAHEAD])
+@pytest.mark.parametrize("k", [1, 3, 6])
+def test_first_k_matches_board_candidates(lookahead, k):
+    """The batched candidate search finds exactly what the sequential DraftBoard finds."""
+    rng = np.random.default_rng(k * 100 + lookahead)
+    board = DraftBoard(load_player_pool(available_years()[0]))
+    batch = BatchBoard(board, lookahead)
+    available, eligible, cursors = random_state(batch, rng, CASES)
+
+    candidates, count = _first_k(batch, available, eligible, cursors, k)
+
+    for row in range(CASES):
+        board.reset()
+        board.available[:] = available[row, :board.size]
+        expected = board.candidates(eligible[row], k)
+        assert count[row] == len(expected)
+        assert candidates[row, :count[row]].tolist() == expected
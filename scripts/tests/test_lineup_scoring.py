@@ -0,0 +1,120 @@
+import os
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utility.batch_engine import batch_to_frame, run_batched_drafts
+from utility.constants import DEFENSIVE_STATS_DIR, NUM_ROUNDS, SEASONAL_STATS_DIR
+from utility.draft_engine import DraftBoard
+from utility.lineup_scoring import LINEUP_SLOTS, score_draft_results
+from utility.player_pool import available_years, load_player_pool
+
+TRIALS_PER_SEASON = 5
+
+
+def baseline_ranking(draft_results_df):
+    """The original per-team DraftResults_details scoring, kept as the reference."""
+    def get_fpts(player):
+        if player is not None and not pd.isna(player['fpts']) and player['fpts'] not in ['', 'NA']:
+            return player['fpts']
+        return 0
+
+    fantasy_ranking = []
+    for trial, trial_data in draft_results_df.groupby('trial_number'):
+        for team, team_data in trial_data.groupby('team_name'):
+            team_data_sorted = team_data.sort_values(by='fpts', ascending=False)
+            by_position = {pos: team_data_sorted[team_data_sorted['position'] == pos]
+                           for pos in ['QB', 'RB', 'WR', 'TE', 'K', 'DST']}
+            lineup = {
+                'QB1': ('QB', 0), 'RB1': ('RB', 0), 'RB2': ('RB', 1), 'WR1': ('WR', 0),
+                'WR2': ('WR', 1), 'TE1': ('TE', 0), 'K1': ('K', 0), 'DST1': ('DST', 0),
+            }
+            players = {slot: by_position[pos].iloc[rank] if len(by_position[pos]) > rank else None
+                       for slot, (pos, rank) in lineup.items()}
+            selected = {player['player_code'] for player in players.values() if player is not None}
+            flex_candidates = team_data_sorted[(~team_data_sorted['position'].isin(['QB', 'DST']))
+                                               & (~team_data_sorted['player_code'].isin(selected))]
+            players['Flex1'] = flex_candidates.iloc[0] if not flex_candidates.empty else None
+
+            row = {'year': team_data['year'].iloc[0], 'trial_number': trial, 'team_name': team}
+            for slot, player in players.items():
+                row[slot] = player['player_name'] if player is not None else None
+                row[f'{slot}_fpts'] = get_fpts(player)
+            fantasy_ranking.append(row)
+    fantasy_ranking_df = pd.DataFrame(fantasy_ranking)
+
+    def calculate_waiver_points(stats_df, column, factor):
+        threshold_index = int(np.floor(NUM_ROUNDS * factor)) - 1
+        if threshold_index < len(stats_df):
+            return stats_df.sort_values(by=column, ascending=False).iloc[threshold_index][column]
+        return 0
+
+    offense = [('qb_waiver_fpts', 'QB', 1.6), ('wr_waiver_fpts', 'WR', 3.6), ('rb_waiver_fpts', 'RB', 3.6),
+               ('te_waiver_fpts', 'TE', 1.6), ('k_waiver_fpts', 'K', 1.6)]
+    fantasy_ranking_df[[column for column, _, _ in offense]] = 0
+    for year in fantasy_ranking_df['year'].unique():
+        stats_df = pd.read_csv(os.path.join(SEASONAL_STATS_DIR, f"player_stats_{year}.csv"))
+        for column, position, factor in offense:
+            position_df = stats_df[stats_df['position'].str.upper() == position]
+            fantasy_ranking_df.loc[fantasy_ranking_df['year'] == year, column] = \
+                calculate_waiver_points(position_df, 'fppr', factor)
+    for year in fantasy_ranking_df['year'].unique():
+        defensive_df = pd.read_csv(os.path.join(DEFENSIVE_STATS_DIR, f"seasonal_defensive_stats_{year}.csv"))
+        fantasy_ranking_df.loc[fantasy_ranking_df['year'] == year, 'dst_waiver_fpts'] = \
+            calculate_waiver_points(defensive_df, 'fpts', 1.6)
+
+    slots = [('QB1', 'qb'), ('RB1', 'rb'), ('RB2', 'rb'), ('WR1', 'wr'), ('WR2', 'wr'), ('TE1', 'te'),
+             ('K1', 'k'), ('DST1', 'dst')]
+    for index, row in fantasy_ranking_df.iterrows():
+        for slot, position in slots:
+            if row[f'{position}_waiver_fpts'] > row[f'{slot}_fpts']:
+                fantasy_ranking_df.at[index, f'{slot}_fpts'] = row[f'{position}_waiver_fpts']
+                fantasy_ranking_df.at[index, slot] = f"waiver_{position}"
+
+    fpts_columns = ['QB1_fpts', 'RB1_fpts', 'RB2_fpts', 'WR1_fpts', 'WR2_fpts', 'TE1_fpts', 'K1_fpts', 'DST1_fpts',
+                    'Flex1_fpts']
+    total_fpts = pd.to_numeric(fantasy_ranking_df[fpts_columns].sum(axis=1), errors='coerce')
+    fantasy_ranking_df['total_fpts'] = total_fpts.fillna(0).replace([float('inf'), -float('inf')], 0)
+    fantasy_ranking_df['rank'] = fantasy_ranking_df.groupby('trial_number')['total_fpts'].rank(
+        ascending=False).astype(int)
+    return fantasy_ranking_df
+
+
+@pytest.fixture(scope="module")
+def draft_results_df():
+    """A few batched drafts of every tracked season, so waiver dtypes are decided over all of them."""
+    rng = np.random.default_rng(0)
+    frames = []
+    for offset, year in enumerate(available_years()):
+        board = DraftBoard(load_player_pool(year))
+        batch_results = run_batched_drafts(board, TRIALS_PER_SEASON, rng)
+        trial_numbers = np.arange(TRIALS_PER_SEASON) + offset * TRIALS_PER_SEASON + 1
+        frames.append(batch_to_frame(board, batch_results, trial_numbers, year))
+    return pd.concat(frames, ignore_index=True)
+
+
+def test_score_draft_results_matches_baseline(draft_results_df):
+    """The vectorized scorer gives the baseline ranking: same columns, order, values and dtypes.
+
+    Among a team's players with equal fpts the scorer starts the earlier
+    pick, where the baseline's descending sort could start either, so a
+    starter's name may differ only for a teammate with the same fpts.
+    """
+    with warnings.catch_warnings():
+        # The reference keeps the original setitem upcasts
+        warnings.simplefilter("ignore", FutureWarning)
+        expected = baseline_ranking(draft_results_df)
+    result = score_draft_results(draft_results_df)
+
+    pd.testing.assert_frame_equal(result.drop(columns=LINEUP_SLOTS), expected.drop(columns=LINEUP_SLOTS),
+                                  check_exact=True)
+    assert result[LINEUP_SLOTS].dtypes.equals(expected[LINEUP_SLOTS].dtypes)
+
+    fpts = draft_results_df.set_index(['trial_number', 'team_name', 'player_name'])['fpts']
+    for slot in LINEUP_SLOTS:
+        differs = result[slot].ne(expected[slot]) & ~(result[slot].isna() & expected[slot].isna())
+        for row in np.flatnonzero(differs):
+            team = (result.at[row, 'trial_number'], result.at[row, 'team_name'])
+            assert fpts[(*team, result.at[row, slot])] == fpts[(*team, expected.at[row, slot])]
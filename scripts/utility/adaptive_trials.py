@@ -0,0 +1,197 @@
+from statistics import NormalDist
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from utility.batch_engine import batch_to_frame, run_batched_drafts
+from utility.constants import BOT_PROFILES, DEFAULT_BOT_PROFILE, MANAGER_PROFILES, NUM_MANAGERS
+from utility.draft_engine import DraftBoard
+from utility.lineup_scoring import score_draft_results
+from utility.pick_sampler import load_samplers
+from utility.player_pool import available_years, load_player_pool
+from utility.profiler import phase
+
+# Statistics tracked per draft slot: column of the fantasy ranking
+STATISTICS = {"fpts": "total_fpts", "finish": "rank"}
+
+
+class RunningStats:
+    """Online count, mean and variance per cell, merged a batch at a time (Chan et al.).
+
+    The first axis indexes strata; ``update`` folds a batch of observations
+    of every cell into one stratum without keeping the observations.
+    """
+
+    def __init__(self, shape):
+        self.count = np.zeros(shape)
+        self.mean = np.zeros(shape)
+        self.m2 = np.zeros(shape)
+
+    def update(self, stratum, values: np.ndarray):
+        """Fold ``values`` (observations x cells) into ``stratum``."""
+        n = len(values)
+        if not n:
+            return
+        batch_mean = values.mean(axis=0)
+        batch_m2 = ((values - batch_mean) ** 2).sum(axis=0)
+        count = self.count[stratum]
+        delta = batch_mean - self.mean[stratum]
+        total = count + n
+        self.mean[stratum] += delta * n / total
+        self.m2[stratum] += batch_m2 + delta ** 2 * count * n / total
+        self.count[stratum] = total
+
+    def variance(self) -> np.ndarray:
+        """Sample variance per cell, infinite until a cell has two observations."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self.count > 1, self.m2 / (self.count - 1), np.inf)
+
+    def stratified(self):
+        """Mean and standard error over equally weighted strata, the target of a uniform season draw."""
+        strata = self.count.shape[0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            standard_error = np.sqrt((self.variance() / self.count).sum(axis=0)) / strata
+        return self.mean.mean(axis=0), standard_error
+
+
+def slot_values(draft_results_df, draft_orders) -> Dict[str, np.ndarray]:
+    """(trials x draft slots) arrays of every tracked statistic.
+
+    ``draft_orders[t, s]`` is the manager picking at slot ``s`` of trial ``t``.
+    """
+    ranking_df = score_draft_results(draft_results_df)
+    trials = np.sort(ranking_df["trial_number"].unique())
+    managers = ranking_df["team_name"].str.slice(len("Team_")).astype(int).to_numpy()
+    rows = np.searchsorted(trials, ranking_df["trial_number"].to_numpy())
+    values = {}
+    for name, column in STATISTICS.items():
+        by_manager = np.full((len(trials), NUM_MANAGERS + 1), np.nan)
+        by_manager[rows, managers] = ranking_df[column].to_numpy(dtype=np.float64)
+        values[name] = np.take_along_axis(by_manager, draft_orders, axis=1)
+    return values
+
+
+def strategy_samplers(strategies: Dict[str, Dict[int, str]]) -> Dict[str, List]:
+    """Samplers per strategy; a strategy maps team numbers to bot profiles on top of MANAGER_PROFILES."""
+    return {name: load_samplers(BOT_PROFILES, {**MANAGER_PROFILES, **overrides}, DEFAULT_BOT_PROFILE)
+            for name, overrides in strategies.items()}
+
+
+def neyman_allocation(std: np.ndarray, total) -> np.ndarray:
+    """Split ``total`` trials across strata in proportion to their standard deviation, at least 2 each."""
+    std = np.where(np.isfinite(std), std, np.nanmax(np.where(np.isfinite(std), std, np.nan)))
+    share = std / std.sum() if std.sum() > 0 else np.full(len(std), 1 / len(std))
+    return np.maximum(np.round(share * total).astype(int), 2)
+
+
+class AdaptiveRun:
+    """Adaptive trial budget: draft in stratified rounds until every interval is narrow enough.
+
+    Each round gives every season (stratum) a share of ``round_trials``,
+    equal at first, then Neyman-allocated on the per-season spread of the
+    statistic furthest from its target. Every strategy replays the same
+    random stream in a round (common random numbers: same draft orders and
+    uniforms), so their per-slot differences are paired. The run stops
+    once the confidence half-width of every slot's statistic, and of its
+    difference to the first strategy, is within ``half_widths``, or after
+    ``max_trials`` trials per strategy.
+    """
+
+    def __init__(self, strategies: Dict[str, Dict[int, str]], half_widths: Dict[str, float], master_seed,
+                 confidence=0.95, round_trials=1000, min_trials=500, max_trials=100000,
+                 years: Optional[List[int]] = None):
+        self.samplers = strategy_samplers(strategies)
+        self.names = list(self.samplers)
+        self.half_widths = half_widths
+        self.master_seed = master_seed
+        self.z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        self.round_trials = round_trials
+        self.min_trials = min_trials
+        self.max_trials = max_trials
+        self.years = list(years or available_years())
+        cells = (len(self.years), len(self.names), NUM_MANAGERS)
+        self.stats = {name: RunningStats(cells) for name in STATISTICS}
+        # Paired differences of every strategy to the first one
+        self.differences = {name: RunningStats(cells) for name in STATISTICS}
+        self.trials = 0
+        self.rounds = 0
+        self.allocation = np.full(len(self.years), max(round_trials // len(self.years), 2))
+
+    def _run_season(self, stratum, num_trials):
+        year = self.years[stratum]
+        board = DraftBoard(load_player_pool(year))
+        seed = np.random.SeedSequence(self.master_seed, spawn_key=(self.rounds, stratum))
+        trial_numbers = np.arange(self.trials, self.trials + num_trials) + 1
+        for index, name in enumerate(self.names):
+            # A fresh generator from the same seed per strategy: common random numbers
+            with phase("run_draft"):
+                batch_results = run_batched_drafts(board, num_trials, np.random.default_rng(seed),
+                                                   samplers=self.samplers[name])
+            draft_results_df = batch_to_frame(board, batch_results, trial_numbers, year)
+            with phase("rank_teams"):
+                values = slot_values(draft_results_df, batch_results["draft_orders"])
+            if index == 0:
+                baseline = values
+            for statistic, observed in values.items():
+                self.stats[statistic].update((stratum, index), observed)
+                self.differences[statistic].update((stratum, index), observed - baseline[statistic])
+
+    def half_width_ratios(self) -> Dict[str, np.ndarray]:
+        """Confidence half-width over target per (strategy, slot), for levels and differences."""
+        ratios = {}
+        for statistic, target in self.half_widths.items():
+            _, se = self.stats[statistic].stratified()
+            ratios[statistic] = self.z * se / target
+            if len(self.names) > 1:
+                _, se = self.differences[statistic].stratified()
+                ratios[f"{statistic}_diff"] = self.z * se[1:] / target
+        return ratios
+
+    def converged(self) -> bool:
+        if self.trials < self.min_trials:
+            return False
+        return all(np.all(ratio <= 1) for ratio in self.half_width_ratios().values())
+
+    def _reallocate(self):
+        """Neyman allocation on the statistic and cell currently furthest from its target."""
+        worst, worst_ratio = None, -np.inf
+        for key, ratio in self.half_width_ratios().items():
+            cell = np.unravel_index(np.argmax(ratio), ratio.shape)
+            if ratio[cell] > worst_ratio:
+                worst, worst_ratio = (key, cell), ratio[cell]
+        key, (strategy, slot) = worst
+        if key.endswith("_diff"):
+            variance = self.differences[key[:-len("_diff")]].variance()[:, strategy + 1, slot]
+        else:
+            variance = self.stats[key].variance()[:, strategy, slot]
+        self.allocation = neyman_allocation(np.sqrt(variance), self.round_trials)
+
+    def run(self):
+        """Draft rounds until converged or out of budget; returns the summary."""
+        while self.trials < self.max_trials:
+            for stratum, num_trials in enumerate(self.allocation):
+                self._run_season(stratum, int(num_trials))
+                self.trials += int(num_trials)
+            self.rounds += 1
+            if self.converged():
+                break
+            self._reallocate()
+        return self.summary()
+
+    def summary(self) -> pd.DataFrame:
+        """One row per (strategy, draft slot): stratified means and half-widths, and differences to the first strategy."""
+        frame = pd.DataFrame({
+            "strategy": np.repeat(self.names, NUM_MANAGERS),
+            "draft_slot": np.tile(np.arange(1, NUM_MANAGERS + 1), len(self.names)),
+            "trials": self.trials,
+        })
+        for statistic in STATISTICS:
+            mean, se = self.stats[statistic].stratified()
+            frame[f"{statistic}_mean"] = mean.ravel()
+            frame[f"{statistic}_half_width"] = (self.z * se).ravel()
+            if len(self.names) > 1:
+                mean, se = self.differences[statistic].stratified()
+                frame[f"{statistic}_diff"] = mean.ravel()
+                frame[f"{statistic}_diff_half_width"] = (self.z * se).ravel()
+        return frame
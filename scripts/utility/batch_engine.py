@@ -0,0 +1,241 @@
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utility.constants import (
+    NUM_MANAGERS,
+    NUM_ROUNDS,
+    POSITIONS,
+)
+from utility.draft_engine import LIMITS, RB_CODE, STARTERS, DraftBoard
+from utility.pick_sampler import PickSampler, cumulative_tables, default_samplers
+from utility.player_pool import available_years, load_player_pool
+from utility.profiler import phase
+
+# Players looked ahead per (trial, position) before falling back to a full scan
+LOOKAHEAD = 8
+
+
+class BatchBoard:
+    """Player axis shared by every trial of a season.
+
+    ``table[p]`` lists the board indices of position ``p`` in ADP order,
+    padded with the sentinel ``size`` so lookahead windows never need
+    clipping; the availability matrix carries a matching always-False
+    sentinel column.
+    """
+
+    def __init__(self, board: DraftBoard, lookahead=LOOKAHEAD):
+        self.board = board
+        self.size = board.size
+        self.lookahead = lookahead
+        self.position = board.position.astype(np.intp)
+        self.lengths = np.array([len(indices) for indices in board.by_position])
+        self.table = np.full((len(POSITIONS), self.lengths.max() + lookahead), self.size, dtype=np.intp)
+        for code, indices in enumerate(board.by_position):
+            self.table[code, :len(indices)] = indices
+        self.row_offsets = np.arange(len(POSITIONS)) * self.table.shape[1]
+
+
+def _first_k_full_scan(batch, available, eligible, k):
+    """First ``k`` available eligible board indices per row, scanning the whole board."""
+    valid = available[:, :batch.size] & eligible[:, batch.position]
+    ranks = np.cumsum(valid, axis=1)
+    count = np.minimum(ranks[:, -1], k)
+    candidates = np.full((len(valid), k), batch.size, dtype=np.intp)
+    for j in range(k):
+        column = np.argmax(ranks > j, axis=1)
+        candidates[:, j] = np.where(count > j, column, batch.size)
+    return candidates, count
+
+
+def _first_k(batch, available, eligible, cursors, k):
+    """First ``k`` available eligible board indices for every trial.
+
+    Merges the lookahead window of every eligible position; rows where a
+    window runs dry before the position list ends are rescanned in full.
+    """
+    num_trials, width = available.shape
+    window = (cursors + batch.row_offsets)[:, :, None] + np.arange(batch.lookahead)
+    indices = batch.table.take(window)
+    valid = available.reshape(-1).take(indices + (np.arange(num_trials) * width)[:, None, None])
+    valid &= eligible[:, :, None]
+
+    merged = np.where(valid, indices, batch.size).reshape(num_trials, -1)
+    candidates = np.partition(merged, k - 1, axis=1)[:, :k]
+    candidates.sort(axis=1)
+    count = (candidates < batch.size).sum(axis=1)
+
+    # A window that runs out before its position list does can only hide a
+    # candidate if its last player is ranked ahead of the current k-th pick
+    in_window = valid.sum(axis=2)
+    short = eligible & (in_window < k) & (cursors + batch.lookahead < batch.lengths)
+    short &= indices[:, :, -1] < candidates[:, -1:]
+
+    rescan = np.flatnonzero(short.any(axis=1))
+    if len(rescan):
+        candidates[rescan], count[rescan] = _first_k_full_scan(
+            batch, available[rescan], eligible[rescan], k
+        )
+    return candidates, count
+
+
+def _advance_cursors(batch, available, cursors, rows, codes):
+    """Move each trial's cursor for ``codes`` past drafted players at the head.
+
+    Everything before a cursor is drafted; when the whole lookahead window is
+    drafted the cursor jumps past it and is refined on a later pick.
+    """
+    width = available.shape[1]
+    positions = cursors[rows, codes]
+    window = (positions + batch.row_offsets[codes])[:, None] + np.arange(batch.lookahead)
+    heads = available.reshape(-1).take(batch.table.take(window) + (rows * width)[:, None])
+    step = np.where(heads.any(axis=1), heads.argmax(axis=1), batch.lookahead)
+    cursors[rows, codes] = np.minimum(positions + step, batch.lengths[codes])
+
+
+def run_batched_drafts(board: DraftBoard, num_trials, rng: np.random.Generator,
+                       lookahead=LOOKAHEAD, samplers: List[PickSampler] = None) -> Dict[str, np.ndarray]:
+    """Run ``num_trials`` snake drafts of one season in lockstep.
+
+    Every pick slot is resolved for all trials with array operations:
+    availability is a (trials x players) matrix and roster counts a
+    (trials x teams x positions) tensor. Managers pick with the same bot
+    profiles as ``run_draft``. Returns the picked board index and
+    drafting manager per (trial, pick), plus each trial's draft order.
+    """
+    batch = BatchBoard(board, lookahead)
+    rows = np.arange(num_trials)
+    available = np.ones((num_trials, batch.size + 1), dtype=bool)
+    available[:, batch.size] = False
+    cursors = np.zeros((num_trials, len(POSITIONS)), dtype=np.intp)
+    team_counts = np.tile(STARTERS, (num_trials, NUM_MANAGERS + 1, 1))
+    required_positions = team_counts.copy()
+
+    draft_orders = rng.permuted(np.tile(np.arange(1, NUM_MANAGERS + 1), (num_trials, 1)), axis=1)
+    picks = np.empty((num_trials, NUM_MANAGERS * NUM_ROUNDS), dtype=np.intp)
+    managers = np.empty((num_trials, NUM_MANAGERS * NUM_ROUNDS), dtype=np.int16)
+    windows, cum_weights = cumulative_tables(samplers or default_samplers())
+    rb_only = np.arange(len(POSITIONS)) == RB_CODE
+
+    pick = 0
+    for round_num in range(1, NUM_ROUNDS + 1):
+        current_order = draft_orders if round_num % 2 != 0 else draft_orders[:, ::-1]
+        k = int(windows[:, round_num].max())
+
+        for slot in range(NUM_MANAGERS):
+            manager = current_order[:, slot]
+
+            # Select player based on position constraints
+            eligible = team_counts[rows, manager] < LIMITS
+            unmet = required_positions[rows, manager] > 0
+            has_unmet = unmet.any(axis=1)
+            eligible[has_unmet] &= unmet[has_unmet]
+
+            # Special rule for Team_1 in rounds 1–3: best available RB
+            special = (manager == 1) & (round_num <= 3)
+            eligible[special] = rb_only
+
+            candidates, count = _first_k(batch, available, eligible, cursors, k)
+
+            if special.any():
+                no_rb = np.flatnonzero(special & (count == 0))
+                if len(no_rb):
+                    everyone = np.ones((len(no_rb), len(POSITIONS)), dtype=bool)
+                    candidates[no_rb, :1], count[no_rb] = _first_k_full_scan(
+                        batch, available[no_rb], everyone, 1
+                    )
+            if (count == 0).any():
+                raise IndexError(f"No eligible players left at pick {pick + 1}")
+
+            # Weighted selection over the first ``count`` candidates of each manager's window
+            cum = cum_weights[manager, round_num, :k]
+            totals = cum[rows, count - 1]
+            draws = rng.random(num_trials) * totals
+            choice = ((draws[:, None] >= cum[:, :-1]) & (np.arange(k - 1) < count[:, None] - 1)).sum(axis=1)
+            choice[special] = 0
+            selected = candidates[rows, choice]
+
+            # Update position counts and the board
+            codes = batch.position[selected]
+            team_counts[rows, manager, codes] += 1
+            needed = required_positions[rows, manager, codes] > 0
+            required_positions[rows[needed], manager[needed], codes[needed]] -= 1
+            available[rows, selected] = False
+            _advance_cursors(batch, available, cursors, rows, codes)
+
+            picks[:, pick] = selected
+            managers[:, pick] = manager
+            pick += 1
+
+    return {"picks": picks, "managers": managers, "draft_orders": draft_orders}
+
+
+def batch_to_frame(board: DraftBoard, batch_results, trial_numbers, year) -> pd.DataFrame:
+    """Expand a batched run into the DraftSimulator ``draft_results`` layout."""
+    picks = batch_results["picks"]
+    num_trials, num_picks = picks.shape
+    flat = picks.ravel()
+    overall_pick = np.tile(np.arange(1, num_picks + 1), num_trials)
+    fpts = board.fpts_rounded[flat]
+    # Match the sequential engine, where the first pick keeps unrounded fpts
+    first = overall_pick == 1
+    fpts[first] = board.fpts[flat[first]]
+    return pd.DataFrame({
+        "trial_number": np.repeat(np.asarray(trial_numbers), num_picks),
+        "round": (overall_pick - 1) // NUM_MANAGERS + 1,
+        "overall_pick": overall_pick,
+        "team_name": np.char.add("Team_", batch_results["managers"].ravel().astype(str)).astype(object),
+        "player_name": board.player_name[flat],
+        "player_code": board.player_code[flat],
+        "position": np.asarray(POSITIONS, dtype=object)[board.position[flat]],
+        "fpts": fpts,
+        "year": year,
+    })
+
+
+def simulate_batched(trial_numbers, master_seed, batch_size=10000) -> Iterator[pd.DataFrame]:
+    """Batched counterpart of the process runner.
+
+    Draws a season per trial, then runs each season's trials in lockstep
+    batches of at most ``batch_size`` so they share one player axis. Yields
+    one ``draft_results`` frame per batch, grouped by season.
+    """
+    for results_df, _ in batched_units(trial_numbers, master_seed, batch_size):
+        yield results_df
+
+
+def batched_units(trial_numbers, master_seed, batch_size=10000, batches_done=0,
+                  rng_state=None) -> Iterator[Tuple[pd.DataFrame, Dict]]:
+    """``simulate_batched`` that also yields the RNG state after each batch.
+
+    Resuming with ``batches_done`` and the state recorded after that batch
+    skips the finished batches and continues the same random stream.
+    """
+    trial_numbers = np.asarray(trial_numbers)
+    rng = np.random.default_rng(master_seed)
+    years = rng.choice(available_years(), size=len(trial_numbers))
+    if rng_state is not None:
+        rng.bit_generator.state = rng_state
+    batch = 0
+    for year in np.unique(years):
+        season_trials = trial_numbers[years == year]
+        starts = range(0, len(season_trials), batch_size)
+        if batch + len(starts) <= batches_done:
+            batch += len(starts)
+            continue
+        with phase("load_pool"):
+            data_df = load_player_pool(year)
+        with phase("board_build"):
+            board = DraftBoard(data_df)
+        for start in starts:
+            batch += 1
+            if batch <= batches_done:
+                continue
+            trials = season_trials[start:start + batch_size]
+            with phase("run_draft"):
+                batch_results = run_batched_drafts(board, len(trials), rng)
+            with phase("batch_to_frame"):
+                results_df = batch_to_frame(board, batch_results, trials, int(year))
+            yield results_df, rng.bit_generator.state
@@ -0,0 +1,170 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utility.pbp_store import STORE_COLUMNS, write_pbp
+
+# Synthetic season drafted by the benchmarks, and the season its play-by-play sample is scraped as
+FIXTURE_YEAR = 2099
+PBP_FIXTURE_YEAR = FIXTURE_YEAR + 1
+FIXTURE_WEEKS = 18
+# Players per position, about the size of a real ADP board
+FIXTURE_PLAYERS = {"QB": 64, "RB": 140, "WR": 170, "TE": 68, "K": 48, "DST": 32}
+# Season fpts of each position's best player; the rest decay from it
+FIXTURE_TOP_FPTS = {"QB": 380, "RB": 320, "WR": 310, "TE": 220, "K": 150, "DST": 140}
+
+
+def _players(rng) -> pd.DataFrame:
+    frames = []
+    for position, count in FIXTURE_PLAYERS.items():
+        rank = np.arange(count)
+        if position == "DST":
+            ids = [f"T{i:02d}" for i in rank]
+        else:
+            ids = [f"99-{position}{i:05d}" for i in rank]
+        season = FIXTURE_TOP_FPTS[position] * np.exp(-rank / (count / 3)) + rng.normal(0, 15, count)
+        frames.append(pd.DataFrame({"player_id": ids, "player_name": [f"{position} Player {i}" for i in rank],
+                                    "position": position, "season_fpts": season}))
+    return pd.concat(frames, ignore_index=True)
+
+
+def _weekly_points(rng, players) -> np.ndarray:
+    """(players x weeks) points around each player's season pace, with one bye week each."""
+    pace = players["season_fpts"].to_numpy()[:, None] / (FIXTURE_WEEKS - 1)
+    points = np.round(rng.normal(pace, 6.0, (len(players), FIXTURE_WEEKS)), 2)
+    points[np.arange(len(players)), rng.integers(4, 14, len(players))] = 0.0
+    return points
+
+
+def _pbp_sample(rng, players, year, num_plays) -> pd.DataFrame:
+    """Play-by-play rows with every column the scrapers read, drawn over the fixture players."""
+    n = num_plays
+    teams = players.loc[players["position"] == "DST", "player_id"].to_numpy()
+    skill = players.loc[~players["position"].isin(["K", "DST"]), "player_id"].to_numpy()
+    kickers = players.loc[players["position"] == "K", "player_id"].to_numpy()
+    play_type = rng.choice(["pass", "run", "field_goal", "extra_point", "kickoff", "punt", "no_play"], n,
+                           p=[0.45, 0.35, 0.04, 0.05, 0.05, 0.04, 0.02])
+
+    def maybe(ids, share):
+        return np.where(rng.random(n) < share, rng.choice(ids, n), None)
+
+    def flag(share):
+        return (rng.random(n) < share).astype(float)
+
+    def yards(share, low, high):
+        return np.where(rng.random(n) < share, rng.integers(low, high, n), np.nan)
+
+    pbp = pd.DataFrame({
+        "game_id": [f"{year}_{week:02d}_G{game}" for week, game in zip(rng.integers(1, 19, n), rng.integers(0, 16, n))],
+        "play_id": np.arange(n, dtype=float),
+        "season": year,
+        "week": rng.integers(1, FIXTURE_WEEKS + 1, n),
+        "play_type": play_type,
+        "posteam": rng.choice(teams, n),
+        "defteam": rng.choice(teams, n),
+        "td_team": maybe(teams, 0.05),
+        "passer_player_id": maybe(skill, 0.45),
+        "rusher_player_id": maybe(skill, 0.35),
+        "receiver_player_id": maybe(skill, 0.4),
+        "kicker_player_id": np.where(np.isin(play_type, ["field_goal", "extra_point", "kickoff"]),
+                                     rng.choice(kickers, n), None),
+        "fumbled_1_player_id": maybe(skill, 0.02),
+        "kickoff_returner_player_id": np.where(play_type == "kickoff", rng.choice(skill, n), None),
+        "punt_returner_player_id": np.where(play_type == "punt", rng.choice(skill, n), None),
+        "pass_touchdown": flag(0.04),
+        "rush_touchdown": flag(0.02),
+        "touchdown": flag(0.06),
+        "return_touchdown": flag(0.005),
+        "passing_yards": yards(0.4, -5, 60),
+        "rushing_yards": yards(0.35, -5, 40),
+        "receiving_yards": yards(0.4, -5, 60),
+        "complete_pass": flag(0.3),
+        "pass_attempt": flag(0.45),
+        "interception": flag(0.02),
+        "fumble_lost": flag(0.01),
+        "fumble_recovery_1_team": maybe(teams, 0.01),
+        "kick_distance": np.where(play_type == "field_goal", rng.integers(18, 65, n), np.nan),
+        "field_goal_result": np.where(play_type == "field_goal",
+                                      rng.choice(["made", "missed", "blocked"], n, p=[0.85, 0.12, 0.03]), None),
+        "extra_point_result": np.where(play_type == "extra_point",
+                                       rng.choice(["good", "failed", "blocked"], n, p=[0.94, 0.05, 0.01]), None),
+        "two_point_attempt": flag(0.01),
+        "two_point_conv_result": np.where(rng.random(n) < 0.01, rng.choice(["success", "failure"], n), None),
+        "yards_gained": rng.integers(-5, 50, n).astype(float),
+        "sack": flag(0.05),
+        "safety": flag(0.002),
+        "punt_blocked": flag(0.002),
+    })
+    names = dict(zip(players["player_id"], players["player_name"]))
+    for role in ["passer", "rusher", "receiver", "kicker"]:
+        pbp[f"{role}_player_name"] = pbp[f"{role}_player_id"].map(names)
+    return pbp[STORE_COLUMNS]
+
+
+def write_fixture(root: Path, seed=0, num_plays=50000) -> Path:
+    """Write a deterministic synthetic project under ``root`` with the src/data layout.
+
+    One FIXTURE_YEAR season gets an ADP board, seasonal and weekly stats
+    for every position and a roster file; a PBP_FIXTURE_YEAR play-by-play
+    sample feeds the scrapers. Code run from ``root/scripts`` resolves
+    PROJECT_ROOT to ``root`` and reads only these files.
+    """
+    root = Path(root)
+    rng = np.random.default_rng(seed)
+    data = root / "src" / "data"
+    for folder in ["adp", "seasonalstats", "defensivestats", "results", "pbp"]:
+        os.makedirs(data / folder, exist_ok=True)
+    os.makedirs(root / "scripts", exist_ok=True)
+    (root / "requirements.txt").touch()
+
+    players = _players(rng)
+    weekly = _weekly_points(rng, players)
+    players["fppr"] = weekly.sum(axis=1)
+    offense = players["position"] != "DST"
+
+    # ADP: the true ranking seen through noise, best pick first
+    adp_order = np.argsort(-(players["fppr"].to_numpy() + rng.normal(0, 40, len(players))), kind="stable")
+    adp = players.iloc[adp_order].reset_index(drop=True)
+    position_rank = adp.groupby("position").cumcount() + 1
+    adp_df = pd.DataFrame({
+        "player_name": adp["player_name"],
+        "player_id": adp["player_id"],
+        "FPPRPOS": adp["position"] + position_rank.astype(str),
+        "FPPRAVG": np.arange(1, len(adp) + 1, dtype=float),
+        "HPPRPOS": adp["position"] + position_rank.astype(str),
+        "HPPRAVG": np.arange(1, len(adp) + 1, dtype=float),
+        "STRDPOS": adp["position"] + position_rank.astype(str),
+        "STRDAVG": np.arange(1, len(adp) + 1, dtype=float),
+        "POSITION": adp["position"],
+    })
+    adp_df.to_csv(data / "adp" / f"{FIXTURE_YEAR}ADP.csv", index=False)
+
+    seasonal = players[offense]
+    pd.DataFrame({
+        "player_id": seasonal["player_id"], "player_name": seasonal["player_name"],
+        "fppr": seasonal["fppr"], "hppr": seasonal["fppr"] * 0.9, "position": seasonal["position"],
+    }).to_csv(data / "seasonalstats" / f"player_stats_{FIXTURE_YEAR}.csv", index=False)
+
+    weeks = np.arange(1, FIXTURE_WEEKS + 1)
+    pd.DataFrame({
+        "player_id": np.repeat(seasonal["player_id"].to_numpy(), FIXTURE_WEEKS),
+        "week": np.tile(weeks, offense.sum()),
+        "fppr": weekly[offense.to_numpy()].ravel(),
+        "hppr": weekly[offense.to_numpy()].ravel() * 0.9,
+    }).to_csv(data / "seasonalstats" / f"weekly_player_stats_{FIXTURE_YEAR}.csv", index=False)
+
+    defense = players[~offense]
+    pd.DataFrame({"season": FIXTURE_YEAR, "pa_team": defense["player_id"], "fpts": defense["fppr"]}).to_csv(
+        data / "defensivestats" / f"seasonal_defensive_stats_{FIXTURE_YEAR}.csv", index=False)
+    pd.DataFrame({
+        "season": FIXTURE_YEAR,
+        "week": np.tile(weeks, len(defense)),
+        "pa_team": np.repeat(defense["player_id"].to_numpy(), FIXTURE_WEEKS),
+        "fpts": weekly[~offense.to_numpy()].ravel(),
+    }).to_csv(data / "defensivestats" / f"weekly_defensive_stats_{FIXTURE_YEAR}.csv", index=False)
+
+    players[["player_id", "player_name", "position"]].to_csv(data / "nfl_rosters.csv", index=False)
+    write_pbp(PBP_FIXTURE_YEAR, _pbp_sample(rng, players, PBP_FIXTURE_YEAR, num_plays), data / "pbp")
+    return root
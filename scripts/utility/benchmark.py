@@ -0,0 +1,203 @@
+import importlib.util
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from utility.constants import BENCHMARK_REPEATS
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+REPORT_PATTERN = "bench-*.json"
+
+# Metric name: (unit, higher is better)
+METRICS = {
+    "simulate_draft": ("ms/draft", False),
+    "simulate_batched": ("ms/draft", False),
+    "rank_teams": ("ms/1k teams", False),
+    "season_sim": ("ms/1k teams", False),
+    "env_steps": ("steps/s", True),
+    "vec_env_steps": ("steps/s", True),
+    "scraper_offense": ("s/season", False),
+    "scraper_defense": ("s/season", False),
+}
+
+
+def best_time(fn: Callable, repeats=BENCHMARK_REPEATS) -> float:
+    """Fastest wall time of ``repeats`` calls, in seconds."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def load_script(path: Path, name: str):
+    """Import a script by path (the scrapers' file names are not valid module names)."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_suite(num_drafts=200, env_steps=5000, repeats=BENCHMARK_REPEATS) -> Dict[str, Dict]:
+    """Time every stage on the fixture project in the working directory.
+
+    Must run from a write_fixture root's scripts folder, since data paths
+    are resolved from the working directory when utility.constants loads.
+    Each stage is warmed up once so caches and the data store are built
+    before timing.
+    """
+    from utility.batch_engine import simulate_batched
+    from utility.bench_fixtures import FIXTURE_YEAR, PBP_FIXTURE_YEAR
+    from utility.constants import BATCH_SIZE, NUM_MANAGERS, PBP_DIR
+    from utility.draft_env import DraftEnvironment
+    from utility.lineup_scoring import score_draft_results
+    from utility.season_sim import simulate_seasons
+
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    import DraftSimulator
+
+    results = {}
+
+    def record(name, value):
+        unit, higher_is_better = METRICS[name]
+        results[name] = {"value": float(value), "unit": unit, "higher_is_better": higher_is_better}
+
+    def draft_all():
+        rng = np.random.default_rng(0)
+        return [row for trial in range(1, num_drafts + 1) for row in DraftSimulator.simulate_draft(trial, rng)]
+
+    draft_results_df = pd.DataFrame(draft_all())
+    record("simulate_draft", best_time(draft_all, repeats) * 1e3 / num_drafts)
+    batched = lambda: list(simulate_batched(range(1, num_drafts + 1), 0, BATCH_SIZE))
+    batched()
+    record("simulate_batched", best_time(batched, repeats) * 1e3 / num_drafts)
+
+    thousands_of_teams = num_drafts * NUM_MANAGERS / 1000
+    score_draft_results(draft_results_df)
+    record("rank_teams", best_time(lambda: score_draft_results(draft_results_df), repeats) * 1e3 / thousands_of_teams)
+    simulate_seasons(draft_results_df, seed=0)
+    record("season_sim", best_time(lambda: simulate_seasons(draft_results_df, seed=0), repeats) * 1e3 / thousands_of_teams)
+
+    def step_env(env, steps):
+        rng = np.random.default_rng(0)
+        env.reset(seed=0)
+        for _ in range(steps):
+            action = rng.choice(np.flatnonzero(env.action_masks()))
+            _, _, terminated, truncated, _ = env.step(action)
+            if terminated or truncated:
+                env.reset()
+
+    env = DraftEnvironment(year=FIXTURE_YEAR, opponent_mode="scarcity")
+    step_env(env, 100)
+    record("env_steps", env_steps / best_time(lambda: step_env(env, env_steps), repeats))
+
+    try:
+        from utility.draft_vec_env import DraftVecEnv
+    except ImportError as error:
+        results["vec_env_steps"] = {"skipped": str(error)}
+    else:
+        vec_env = DraftVecEnv(num_envs=256, year=FIXTURE_YEAR, seed=0, opponent_mode="scarcity")
+        vec_env.reset()
+        rng = np.random.default_rng(0)
+
+        def step_vec_env():
+            for _ in range(env_steps // 256 + 1):
+                masks = vec_env.action_masks()
+                vec_env.step((rng.random(masks.shape) * masks).argmax(axis=1))
+
+        record("vec_env_steps", (env_steps // 256 + 1) * 256 / best_time(step_vec_env, repeats))
+
+    offense = load_script(SCRIPTS_DIR / "scraper" / "1-data-DraftAI.py", "scraper_offense")
+    defense = load_script(SCRIPTS_DIR / "scraper" / "2-data-DraftAIDefenseStats.py", "scraper_defense")
+    record("scraper_offense", best_time(lambda: offense.process_season_data(PBP_FIXTURE_YEAR, pbp_dir=PBP_DIR), repeats))
+    record("scraper_defense", best_time(
+        lambda: defense.calculate_seasonal_defensive_stats_with_points_allowed_and_buckets(PBP_FIXTURE_YEAR, pbp_dir=PBP_DIR),
+        repeats))
+    return results
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=SCRIPTS_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_in_fixture(num_drafts=200, env_steps=5000, num_plays=50000, repeats=BENCHMARK_REPEATS, seed=0) -> Dict:
+    """Write a synthetic project to a temp directory and run the suite there in a fresh process."""
+    from utility.bench_fixtures import write_fixture
+
+    with tempfile.TemporaryDirectory() as root:
+        write_fixture(root, seed=seed, num_plays=num_plays)
+        output = Path(root) / "results.json"
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(SCRIPTS_DIR), os.environ.get("PYTHONPATH", "")]))
+        subprocess.run([sys.executable, "-m", "utility.benchmark", str(output), str(num_drafts), str(env_steps),
+                        str(repeats)], cwd=Path(root) / "scripts", env=env, check=True, stdout=subprocess.DEVNULL)
+        with open(output) as f:
+            results = json.load(f)
+
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "fixture": {"seed": seed, "num_drafts": num_drafts, "env_steps": env_steps, "num_plays": num_plays,
+                    "repeats": repeats},
+        "results": results,
+    }
+
+
+def write_report(report: Dict, directory: Path) -> Path:
+    os.makedirs(directory, exist_ok=True)
+    path = Path(directory) / f"bench-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    return path
+
+
+def latest_report(directory: Path) -> Optional[Path]:
+    reports = sorted(Path(directory).glob(REPORT_PATTERN))
+    return reports[-1] if reports else None
+
+
+def compare(report: Dict, baseline: Optional[Dict], tolerance) -> List[str]:
+    """Print each metric against the baseline; returns the metrics worse by more than ``tolerance``."""
+    regressions = []
+    if baseline is not None and baseline.get("fixture") != report["fixture"]:
+        print("Baseline ran on different fixture settings; not comparing.")
+        baseline = None
+    for name, result in report["results"].items():
+        if "skipped" in result:
+            print(f"{name:<18} skipped ({result['skipped']})")
+            continue
+        line = f"{name:<18} {result['value']:>12.3f} {result['unit']}"
+        previous = (baseline or {}).get("results", {}).get(name, {})
+        if "value" in previous and previous["value"] > 0:
+            change = result["value"] / previous["value"] - 1
+            worse = -change if result["higher_is_better"] else change
+            line += f"  ({change:+.1%} vs {previous['value']:.3f})"
+            if worse > tolerance:
+                line += "  REGRESSION"
+                regressions.append(name)
+        print(line)
+    return regressions
+
+
+if __name__ == "__main__":
+    output, num_drafts, env_steps, repeats = sys.argv[1], *map(int, sys.argv[2:5])
+    suite_results = run_suite(num_drafts, env_steps, repeats)
+    with open(output, "w") as f:
+        json.dump(suite_results, f)
@@ -0,0 +1,60 @@
+import hashlib
+import os
+from pathlib import Path
+from typing import Dict, Iterable
+
+import pandas as pd
+
+
+def file_hash(path: Path) -> str:
+    return hashlib.sha1(Path(path).read_bytes()).hexdigest()
+
+
+def source_manifest(paths: Iterable[Path]) -> Dict[str, Dict]:
+    """mtime, size and sha1 of every source file a cache entry is built from."""
+    manifest = {}
+    for path in map(Path, paths):
+        stat = path.stat()
+        manifest[str(path)] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha1": file_hash(path)}
+    return manifest
+
+
+def is_fresh(cached_manifest: Dict[str, Dict], paths: Iterable[Path]) -> bool:
+    """Check cached sources against disk: mtime first, hash only if mtime moved."""
+    paths = [Path(path) for path in paths]
+    if set(cached_manifest) != {str(path) for path in paths}:
+        return False
+    for path in paths:
+        entry = cached_manifest[str(path)]
+        if not path.exists():
+            return False
+        stat = path.stat()
+        if stat.st_mtime_ns == entry["mtime_ns"] and stat.st_size == entry["size"]:
+            continue
+        if file_hash(path) != entry["sha1"]:
+            return False
+    return True
+
+
+def read_cache(path: Path, version, paths: Iterable[Path]):
+    """Cached value at ``path``, or None when missing, stale or unreadable."""
+    path = Path(path)
+    if not path.exists():
+        return None
+    try:
+        payload = pd.read_pickle(path)
+    except Exception:
+        return None
+    if payload.get("version") != version or not is_fresh(payload["sources"], paths):
+        return None
+    return payload["value"]
+
+
+def write_cache(path: Path, version, paths: Iterable[Path], value):
+    path = Path(path)
+    os.makedirs(path.parent, exist_ok=True)
+    payload = {"version": version, "sources": source_manifest(paths), "value": value}
+    # Write then rename so parallel workers never read a half-written file
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    pd.to_pickle(payload, tmp_path)
+    os.replace(tmp_path, path)
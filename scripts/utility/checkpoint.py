@@ -0,0 +1,109 @@
+import json
+import os
+import random
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from utility.cache import is_fresh, source_manifest
+from utility.data_store import store_sources
+from utility.results_sink import result_parts
+
+CAMPAIGN_VERSION = 1
+MANIFEST_FILE = "campaign.json"
+
+
+class Campaign:
+    """Checkpoint manifest of a DraftSimulator run, for resuming after a crash.
+
+    A run is a sequence of units (process-runner chunks or batched-engine
+    batches) over a fixed trial list. ``commit`` flushes every results sink
+    and then records how many units and trials are done, each sink's part
+    and row counts and, for the batched engine, the RNG state after the
+    last unit. A rerun with the same settings and data files resumes: sinks
+    keep the committed parts, drop anything written after them, and the
+    runner skips the finished units. Trial seeds depend only on the master
+    seed and trial number (and batched runs restore their RNG state), so the
+    merged output equals an uninterrupted run's.
+    """
+
+    def __init__(self, directory, settings: Dict, master_seed: Optional[int] = None, interval=0.0, resume=True):
+        self.path = Path(directory) / MANIFEST_FILE
+        self.settings = settings
+        self.interval = interval
+        self._last_commit = time.monotonic()
+        self._sources = source_manifest(store_sources())
+
+        manifest = self._read() if resume else None
+        if manifest is not None and (master_seed is None or master_seed == manifest["master_seed"]):
+            self.master_seed = manifest["master_seed"]
+            self.units_done = manifest["units_done"]
+            self.trials_done = manifest["trials_done"]
+            self.sinks = manifest["sinks"]
+            self.rng_state = manifest["rng_state"]
+        else:
+            self.master_seed = master_seed if master_seed is not None else random.randrange(2**32)
+            self.units_done = 0
+            self.trials_done = 0
+            self.sinks = {}
+            self.rng_state = None
+        self.resumed = self.units_done > 0
+
+    def _read(self) -> Optional[Dict]:
+        """The manifest of an unfinished run with these settings and data files, if any."""
+        if not self.path.exists():
+            return None
+        try:
+            with open(self.path) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (manifest.get("version") != CAMPAIGN_VERSION or manifest.get("complete")
+                or manifest.get("settings") != json.loads(json.dumps(self.settings))
+                or not is_fresh(manifest["sources"], store_sources())):
+            return None
+        # Every committed part must still be there
+        for sink in manifest["sinks"].values():
+            if len(result_parts(sink["directory"])[:sink["parts"]]) < sink["parts"]:
+                return None
+        return manifest
+
+    def sink_state(self, name) -> Optional[Dict]:
+        """Part and row counts to reopen a sink with, when resuming."""
+        return self.sinks.get(name)
+
+    def commit(self, units_done, trials_done, sinks: Dict, rng_state=None, force=False):
+        """Record progress once ``interval`` seconds have passed since the last commit (or when forced)."""
+        if not force and time.monotonic() - self._last_commit < self.interval:
+            return
+        for sink in sinks.values():
+            sink.flush()
+        self.units_done, self.trials_done, self.rng_state = units_done, trials_done, rng_state
+        self.sinks = {name: sink.state() for name, sink in sinks.items()}
+        self._write(complete=False)
+        self._last_commit = time.monotonic()
+
+    def finish(self, sinks: Dict):
+        """Mark the run complete so the next run starts fresh."""
+        for sink in sinks.values():
+            sink.flush()
+        self.sinks = {name: sink.state() for name, sink in sinks.items()}
+        self._write(complete=True)
+
+    def _write(self, complete):
+        manifest = {
+            "version": CAMPAIGN_VERSION,
+            "settings": self.settings,
+            "sources": self._sources,
+            "master_seed": self.master_seed,
+            "units_done": self.units_done,
+            "trials_done": self.trials_done,
+            "sinks": self.sinks,
+            "rng_state": self.rng_state,
+            "complete": complete,
+        }
+        os.makedirs(self.path.parent, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, self.path)
@@ -18,7 +18,11 @@ ADP_DIR = PROJECT_ROOT / "src/data/adp"
 SEASONAL_STATS_DIR = PROJECT_ROOT / "src/data/seasonalstats"
 DEFENSIVE_STATS_DIR = PROJECT_ROOT / "src/data/defensivestats"
 RESULTS_DIR = PROJECT_ROOT / "src/data/results"
+BENCHMARK_DIR = PROJECT_ROOT / "src/data/results/benchmarks"
 ROSTER_DIR = PROJECT_ROOT / "src/data/nfl_rosters.csv"
+CACHE_DIR = PROJECT_ROOT / "src/data/cache"
+DATA_STORE_DIR = PROJECT_ROOT / "src/data/store"
+PBP_DIR = PROJECT_ROOT / "src/data/pbp"
 
 # Years to pull data from
 YEAR_BEGINNING = 2018
@@ -28,11 +32,103 @@ YEAR_END = 2023
 NUMBER_OF_TRIALS = 1000
 NUM_MANAGERS = 12
 TOTAL_NUM_ROUNDS = 16
+NUM_ROUNDS = TOTAL_NUM_ROUNDS
 
 # Position limits and requirements
 POSITION_LIMITS = {"QB": 4, "RB": 8, "WR": 8, "TE": 3, "K": 3, "DST": 3}
 STARTER_POSITIONS = {"QB": 1, "K": 1, "DST": 1, "RB": 2, "WR": 2, "TE": 1}
 
+# Replacement level: the floor(NUM_ROUNDS * factor)-th best player at a position
+WAIVER_FACTORS = {"QB": 1.6, "RB": 3.6, "WR": 3.6, "TE": 1.6, "K": 1.6, "DST": 1.6}
+
+# Integer position codes used by the array-backed draft engine
+POSITIONS = list(POSITION_LIMITS)
+POSITION_CODES = {pos: code for code, pos in enumerate(POSITIONS)}
+
 # Weighted probabilities for Draft Logic
 ROUND_1_3_WEIGHTS = [0.64, 0.20, 0.10, 0.05, 0.01]
-ROUND_4_16_WEIGHTS = [0.50, 0.10, 0.10, 0.10, 0.10, 0.10]
\ No newline at end of file
+ROUND_4_16_WEIGHTS = [0.50, 0.10, 0.10, 0.10, 0.10, 0.10]
+# Parallel trial runner (MASTER_SEED = None draws a fresh seed per run)
+MASTER_SEED = None
+NUM_WORKERS = None  # None uses every core
+TRIAL_CHUNK_SIZE = 25
+
+# "process" runs trials on the process pool, "batched" advances them in lockstep
+SIMULATION_MODE = "process"
+BATCH_SIZE = 10000
+
+# Streaming results sink (rows per Parquet part; CSV export is optional)
+RESULTS_CHUNK_SIZE = 192000
+EXPORT_CSV = True
+
+# Keep live standings after every round and the final waiver-adjusted ranking
+TRACK_STANDINGS = True
+
+# PPO training: drafts stepped together by the batched DraftVecEnv
+NUM_ENVS = 256
+
+# "batched" trains on one DraftVecEnv, "subprocess" on NUM_ENV_WORKERS env processes
+TRAINING_MODE = "batched"
+NUM_ENV_WORKERS = None  # None uses every core
+TRAINING_SEED = None
+TRAINING_YEARS = None  # None samples from every season with an ADP file
+
+# MaskablePPO (sb3-contrib) only samples legal picks; without it, illegal picks
+# are wasted and earn INVALID_ACTION_PENALTY
+ACTION_MASKING = True
+INVALID_ACTION_PENALTY = -50.0
+
+# "compact": fixed-size DraftFeatures vector shared by every season; "players": per-player availability
+OBSERVATION_MODE = "compact"
+
+# Env opponents: "random" picks uniformly, "scarcity" chases positions with quality players left
+OPPONENT_MODE = "scarcity"
+# Reward bonus per point of tier dropoff when the agent takes a player from a position's best tier
+DROPOFF_REWARD_WEIGHT = 0.1
+
+# Head-to-head seasons: regular-season weeks, then single-elimination playoff weeks
+# (weekly DST stats cover weeks 1-14, so 12 + 2 playoff rounds fit the data)
+SIMULATE_SEASONS = True
+H2H_REGULAR_WEEKS = 12
+PLAYOFF_TEAMS = 4
+SEASON_BATCH_SIZE = 1000
+
+# Benchmarks: best of BENCHMARK_REPEATS timings; a metric more than
+# REGRESSION_TOLERANCE worse than the baseline run is flagged
+BENCHMARK_REPEATS = 3
+REGRESSION_TOLERANCE = 0.2
+
+# Phase profiling of DraftSimulator, DraftResults_details and PPOSimulator-draft: wall time and
+# calls per phase, plus peak traced memory with PROFILE_MEMORY (slows the run). PROFILE_TARGET
+# names one phase (e.g. "pick_selection") to examine with "cprofile" or a "tracemalloc" snapshot
+PROFILE_PHASES = False
+PROFILE_MEMORY = False
+PROFILE_TARGET = None
+PROFILE_TARGET_MODE = "cprofile"
+
+# Opponent bot profiles: (first round, last round, weights over the top-ADP candidates) per
+# round range; the window is as wide as the weights. Managers not in MANAGER_PROFILES
+# (team number -> profile name) draft as DEFAULT_BOT_PROFILE
+BOT_PROFILES = {
+    "adp": [(1, 3, ROUND_1_3_WEIGHTS), (4, NUM_ROUNDS, ROUND_4_16_WEIGHTS)],
+    "chalk": [(1, NUM_ROUNDS, [0.80, 0.15, 0.05])],
+    "reach": [(1, 3, [0.40, 0.25, 0.15, 0.10, 0.10]), (4, NUM_ROUNDS, [0.25, 0.15, 0.15, 0.15, 0.10, 0.10, 0.10])],
+}
+DEFAULT_BOT_PROFILE = "adp"
+MANAGER_PROFILES = {}
+
+# DraftSimulator checkpoints its progress to RESULTS_DIR/campaign.json at most every
+# CHECKPOINT_SECONDS; a rerun with the same settings resumes an unfinished run
+RESUME_CAMPAIGNS = True
+CHECKPOINT_SECONDS = 120
+
+# AdaptiveSimulator: stratified rounds of ADAPTIVE_ROUND_TRIALS drafts across seasons until the
+# ADAPTIVE_CONFIDENCE interval of every draft slot's season points and finish is within
+# ADAPTIVE_HALF_WIDTHS. Strategies map team numbers to bot profiles on top of MANAGER_PROFILES;
+# they share random numbers, and slot differences to the first strategy must converge too
+ADAPTIVE_STRATEGIES = {"default": {}}
+ADAPTIVE_HALF_WIDTHS = {"fpts": 5.0, "finish": 0.1}
+ADAPTIVE_CONFIDENCE = 0.95
+ADAPTIVE_ROUND_TRIALS = 1000
+ADAPTIVE_MIN_TRIALS = 500
+ADAPTIVE_MAX_TRIALS = 100000
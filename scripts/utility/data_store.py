@@ -0,0 +1,110 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from pyarrow import ipc
+
+from utility.cache import is_fresh, source_manifest
+from utility.constants import ADP_DIR, DATA_DIR, DATA_STORE_DIR, DEFENSIVE_STATS_DIR, ROSTER_DIR, SEASONAL_STATS_DIR
+
+STORE_VERSION = 1
+
+# Opened tables in this process, keyed by store file; each maps its file once
+_tables = {}
+
+
+def store_sources() -> List[Path]:
+    """Every CSV the simulators, ranking stage and envs read."""
+    sources = []
+    for folder in (ADP_DIR, SEASONAL_STATS_DIR, DEFENSIVE_STATS_DIR):
+        sources.extend(sorted(Path(folder).glob("*.csv")))
+    return sources + [Path(ROSTER_DIR)]
+
+
+def table_path(source: Path, directory: Path = DATA_STORE_DIR) -> Path:
+    """Store file of a CSV: its path under src/data, or a hashed name for files elsewhere."""
+    source = Path(source).resolve()
+    try:
+        relative = source.relative_to(Path(DATA_DIR).resolve())
+    except ValueError:
+        relative = Path(f"{hashlib.sha1(str(source).encode()).hexdigest()[:12]}_{source.name}")
+    return Path(directory) / relative.with_suffix(".arrow")
+
+
+def _manifest_path(path: Path) -> Path:
+    return path.with_suffix(".json")
+
+
+def is_compiled(source: Path, directory: Path = DATA_STORE_DIR) -> bool:
+    """Whether the store holds an up-to-date copy of ``source``."""
+    manifest_path = _manifest_path(table_path(source, directory))
+    if not manifest_path.exists():
+        return False
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    return manifest.get("version") == STORE_VERSION and is_fresh(manifest["sources"], [source])
+
+
+def compile_table(source: Path, directory: Path = DATA_STORE_DIR) -> Path:
+    """Parse a CSV once and write it as an uncompressed Arrow IPC file for memory mapping."""
+    path = table_path(source, directory)
+    os.makedirs(path.parent, exist_ok=True)
+    table = pa.Table.from_pandas(pd.read_csv(source), preserve_index=False)
+
+    # Write then rename so a worker never maps a half-written file; the manifest goes last
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with ipc.new_file(tmp_path, table.schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp_path, path)
+    manifest = {"version": STORE_VERSION, "sources": source_manifest([source]), "rows": table.num_rows}
+    tmp_path = _manifest_path(path).with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, _manifest_path(path))
+    _tables.pop(path, None)
+    return path
+
+
+def compile_store(sources: Optional[Iterable[Path]] = None, directory: Path = DATA_STORE_DIR) -> List[Path]:
+    """Compile every stale or missing table; returns the files written."""
+    return [compile_table(source, directory) for source in (sources or store_sources())
+            if not is_compiled(source, directory)]
+
+
+def open_table(source: Path, directory: Path = DATA_STORE_DIR) -> pa.Table:
+    """Memory-mapped Arrow table of a CSV, compiled first if the store is stale.
+
+    Columns reference the mapped file directly, so opening costs no parsing
+    and processes mapping the same table share its pages.
+    """
+    path = table_path(source, directory)
+    if not is_compiled(source, directory):
+        compile_table(source, directory)
+    table = _tables.get(path)
+    if table is None:
+        table = ipc.open_file(pa.memory_map(str(path))).read_all()
+        _tables[path] = table
+    return table
+
+
+def read_table(source: Path, columns: Optional[List[str]] = None, directory: Path = DATA_STORE_DIR) -> pd.DataFrame:
+    """A CSV as pandas, read from the store; equal to ``pd.read_csv(source, usecols=columns)``."""
+    table = open_table(source, directory)
+    if columns is not None:
+        table = table.select([name for name in table.column_names if name in set(columns)])
+    df = table.to_pandas()
+    # Arrow nulls come back as None in string columns; read_csv gives NaN
+    for name in table.column_names:
+        if pa.types.is_string(table.schema.field(name).type) and table.column(name).null_count:
+            df[name] = df[name].where(df[name].notna(), np.nan)
+    return df
+
+
+if __name__ == "__main__":
+    written = compile_store()
+    print(f"Compiled {len(written)} tables into {DATA_STORE_DIR}")
@@ -0,0 +1,164 @@
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from utility.constants import (
+    NUM_MANAGERS,
+    NUM_ROUNDS,
+    POSITION_CODES,
+    POSITION_LIMITS,
+    POSITIONS,
+    STARTER_POSITIONS,
+)
+from utility.pick_sampler import PickSampler, default_samplers
+from utility.profiler import phase
+
+# Position rules as vectors indexed by position code
+LIMITS = np.array([POSITION_LIMITS[pos] for pos in POSITIONS], dtype=np.int16)
+STARTERS = np.array([STARTER_POSITIONS[pos] for pos in POSITIONS], dtype=np.int16)
+RB_CODE = POSITION_CODES["RB"]
+
+
+class DraftBoard:
+    """Player board kept as preallocated arrays in ADP order.
+
+    Players are never removed from the arrays; a boolean ``available`` mask is
+    flipped instead, and a cursor per position skips the drafted head of each
+    position list, so candidate lookup only touches the pick window.
+    """
+
+    def __init__(self, data_df: pd.DataFrame):
+        # data_df must already be sorted by ADP (FPPRAVG)
+        self.size = len(data_df)
+        self.player_name = data_df["player_name"].to_numpy(dtype=object)
+        self.player_code = data_df["player_code"].to_numpy(dtype=np.int32)
+        self.position = data_df["POSITION"].map(POSITION_CODES).to_numpy(dtype=np.int8)
+        self.fpts = data_df["fpts"].to_numpy(dtype=np.float64)
+        # The DataFrame engine re-rounded fpts after every pick, so only the
+        # first pick of a draft ever saw the unrounded value
+        self.fpts_rounded = np.round(self.fpts, 2)
+        self.by_position = [np.flatnonzero(self.position == code) for code in range(len(POSITIONS))]
+        self.available = np.ones(self.size, dtype=bool)
+        self.cursors = np.zeros(len(POSITIONS), dtype=np.int64)
+
+    def reset(self):
+        """Make every player available again."""
+        self.available[:] = True
+        self.cursors[:] = 0
+
+    def _advance(self, code):
+        indices = self.by_position[code]
+        cursor = self.cursors[code]
+        while cursor < len(indices) and not self.available[indices[cursor]]:
+            cursor += 1
+        self.cursors[code] = cursor
+        return cursor
+
+    def first_available(self, code=None):
+        """Board index of the best available player, optionally for one position."""
+        if code is not None:
+            cursor = self._advance(code)
+            indices = self.by_position[code]
+            return int(indices[cursor]) if cursor < len(indices) else None
+        heads = [self.first_available(c) for c in range(len(POSITIONS))]
+        heads = [head for head in heads if head is not None]
+        return min(heads) if heads else None
+
+    def candidates(self, eligible, window) -> List[int]:
+        """Board indices of the top ``window`` available players at eligible positions."""
+        found = []
+        for code in np.flatnonzero(eligible):
+            indices = self.by_position[code]
+            taken = 0
+            for cursor in range(self._advance(code), len(indices)):
+                index = indices[cursor]
+                if self.available[index]:
+                    found.append(int(index))
+                    taken += 1
+                    if taken == window:
+                        break
+        found.sort()
+        return found[:window]
+
+    def remove(self, index):
+        self.available[index] = False
+
+
+def run_draft(board: DraftBoard, trial_number, year, rng: np.random.Generator, standings=None,
+              samplers: List[PickSampler] = None) -> List[Dict]:
+    """Run one snake draft on ``board`` and return the pick records.
+
+    Each manager picks with its ``PickSampler`` (``default_samplers()`` when
+    none are passed) from one batch of uniform draws made up front. When a
+    ``DraftStandings`` is passed it is updated after every pick and closed
+    after every round.
+    """
+    samplers = samplers or default_samplers()
+    draft_order = list(range(1, NUM_MANAGERS + 1))
+    rng.shuffle(draft_order)
+    draws = rng.random(NUM_MANAGERS * NUM_ROUNDS).tolist()
+    results = []
+    pick_order = 1
+
+    # Track positions, one row per manager
+    required_positions = np.tile(STARTERS, (NUM_MANAGERS + 1, 1))
+    team_counts = np.tile(STARTERS, (NUM_MANAGERS + 1, 1))
+
+    for round_num in range(1, NUM_ROUNDS + 1):
+        current_order = draft_order if round_num % 2 != 0 else draft_order[::-1]
+
+        for manager in current_order:
+            # Special rule for Team_1 in rounds 1–3
+            if manager == 1 and round_num <= 3:
+                index = board.first_available(RB_CODE)
+                if index is None:
+                    index = board.first_available()
+            else:
+                with phase("pick_selection"):
+                    # Select player based on position constraints
+                    eligible = team_counts[manager] < LIMITS
+                    unmet = required_positions[manager] > 0
+                    if unmet.any():
+                        eligible &= unmet
+
+                    # Weighted selection over the manager's window
+                    sampler = samplers[manager]
+                    candidates = board.candidates(eligible, sampler.window(round_num))
+                    if not candidates:
+                        open_positions = [POSITIONS[code] for code in np.flatnonzero(eligible)]
+                        raise ValueError(f"No eligible players for Team_{manager} in round {round_num} "
+                                         f"(pick {pick_order}), open positions: {open_positions}")
+                    index = sampler.choose(candidates, round_num, draws[pick_order - 1])
+
+            # Update position counts
+            code = board.position[index]
+            team_counts[manager, code] += 1
+            if required_positions[manager, code] > 0:
+                required_positions[manager, code] -= 1
+
+            # Record pick
+            fpts = board.fpts[index] if pick_order == 1 else board.fpts_rounded[index]
+            results.append({
+                "trial_number": trial_number,
+                "round": round_num,
+                "overall_pick": pick_order,
+                "team_name": f"Team_{manager}",
+                "player_name": board.player_name[index],
+                "player_code": board.player_code[index],
+                "position": POSITIONS[code],
+                "fpts": fpts,
+                "year": year
+            })
+
+            if standings is not None:
+                with phase("standings"):
+                    standings.record_pick(manager, POSITIONS[code], fpts, board.player_name[index], pick_order)
+
+            pick_order += 1
+            board.remove(index)
+
+        if standings is not None:
+            with phase("standings"):
+                standings.close_round(round_num)
+    return results
@@ -0,0 +1,210 @@
+import random
+
+import gymnasium as gym
+import numpy as np
+from gymnasium import spaces
+
+from utility.constants import POSITION_CODES, POSITIONS
+from utility.draft_engine import LIMITS
+from utility.draft_features import DraftFeatures
+from utility.player_pool import available_years, load_player_pool
+from utility.profiler import phase
+from utility.replacement_levels import value_over_replacement
+
+# Per-player arrays a DraftPool is made of
+POOL_ARRAYS = ["player_name", "player_code", "position", "fpts", "adp_rank", "vor"]
+
+
+class DraftPool:
+    """A season's player pool as fixed arrays, best projected players first.
+
+    Row ``i`` is action ``i`` for the whole life of the environment. Pools
+    can be padded to a common ``size`` so seasons share one action space;
+    rows from ``num_players`` on are never available.
+    """
+
+    def __init__(self, year):
+        pool = load_player_pool(year)
+        # ADP rank comes from the board order, since some FPPRAVG values are missing
+        pool = pool.assign(adp_rank=np.arange(1, len(pool) + 1))
+        pool = pool.sort_values(by="fpts", ascending=False).reset_index(drop=True)
+        self.year = int(year)
+        self.size = self.num_players = len(pool)
+        self.player_name = pool["player_name"].to_numpy(dtype=object)
+        self.player_code = pool["player_code"].to_numpy(dtype=np.int32)
+        self.position = pool["POSITION"].map(POSITION_CODES).to_numpy(dtype=np.int8)
+        self.fpts = np.nan_to_num(pool["fpts"].to_numpy(dtype=np.float64), nan=0.0)
+        self.adp_rank = pool["adp_rank"].to_numpy(dtype=np.int64)
+        self.vor = value_over_replacement(year, pool["POSITION"], self.fpts)
+
+    @classmethod
+    def from_arrays(cls, year, num_players=None, **arrays):
+        """Wrap existing POOL_ARRAYS (e.g. memory-mapped ones) without copying."""
+        pool = cls.__new__(cls)
+        pool.year = int(year)
+        for name in POOL_ARRAYS:
+            setattr(pool, name, arrays[name])
+        pool.size = len(pool.position)
+        pool.num_players = pool.size if num_players is None else int(num_players)
+        return pool
+
+
+class DraftEnvironment(gym.Env):
+    """Single-agent draft against random or scarcity-driven opponents, per ``opponent_mode``.
+
+    State lives in fixed index arrays: an availability mask, a dense list of
+    still-available players for O(1) opponent sampling and removal, and the
+    agent's roster counts. Observation buffers are updated in place and
+    copied on return, and ``reset`` restores the pool in O(players).
+
+    With ``observation_mode="compact"`` (the default) observations are the
+    fixed-size DraftFeatures vector, the same length for every season;
+    ``"players"`` keeps the per-player availability dict.
+
+    ``action_masks`` gives the legal picks (available and under
+    POSITION_LIMITS) in the form MaskablePPO reads. Without a masking
+    algorithm, an illegal pick is wasted and earns ``invalid_action_penalty``.
+
+    Opponents pick uniformly at random (``opponent_mode="random"``) or, with
+    ``"scarcity"``, take the best-ADP player at a position drawn by quality
+    players left. Taking a player from a position's best remaining tier adds
+    ``dropoff_reward_weight`` times that tier's (positive) dropoff to the
+    reward.
+    """
+
+    metadata = {"render_modes": ["human"]}
+
+    def __init__(self, num_teams=10, roster_size=8, year=None, pool=None, invalid_action_penalty=0.0,
+                 observation_mode="compact", opponent_mode="random", dropoff_reward_weight=0.0):
+        super(DraftEnvironment, self).__init__()
+
+        # Initialize draft data
+        self.num_teams = num_teams
+        self.roster_size = roster_size
+        self.agent_team_id = 1
+        self.invalid_action_penalty = invalid_action_penalty
+        self.observation_mode = observation_mode
+        self.opponent_mode = opponent_mode
+        self.dropoff_reward_weight = dropoff_reward_weight
+
+        # Load the season's player pool, best projected players first
+        if pool is None:
+            if year is None:
+                year = random.choice(available_years())
+            pool = DraftPool(year)
+        self.pool = pool
+        self.year = self.pool.year
+
+        # Action and observation spaces
+        self.action_space = spaces.Discrete(self.pool.size)
+        self.features = DraftFeatures(self.pool, 1, num_teams, roster_size)
+        self.tracker = self.features.tracker
+        if observation_mode == "compact":
+            self.observation_space = self.features.observation_space
+        else:
+            self.observation_space = spaces.Dict({
+                "available_players": spaces.Box(low=0, high=1, shape=(self.pool.size,), dtype=np.float32),
+                "agent_roster": spaces.Box(low=0, high=roster_size, shape=(len(POSITIONS),), dtype=np.float32),
+            })
+
+        # Preallocated state
+        self.available = np.zeros(self.pool.size, dtype=bool)
+        self._free = np.arange(self.pool.size)
+        self._free_slot = np.arange(self.pool.size)
+        self._num_free = 0
+        self.roster_counts = np.zeros(len(POSITIONS), dtype=np.int64)
+        self.agent_roster = []
+        self.current_pick = 0
+        self._observation = {
+            "available_players": np.zeros(self.pool.size, dtype=np.float32),
+            "agent_roster": np.zeros(len(POSITIONS), dtype=np.float32),
+        }
+
+    def reset(self, seed=None, options=None):
+        """Reset the environment at the start of each episode."""
+        with phase("env_reset"):
+            super().reset(seed=seed)
+            # Padding rows past num_players stay drafted, outside the free list
+            num_players = self.pool.num_players
+            self.available[:num_players] = True
+            self._free[:] = np.arange(self.pool.size)
+            self._free_slot[:] = np.arange(self.pool.size)
+            self._num_free = num_players
+            self.roster_counts[:] = 0
+            self.agent_roster = []
+            self.current_pick = 0
+            self._observation["available_players"][:num_players] = 1
+            self._observation["agent_roster"][:] = 0
+            self.features.reset()
+            return self._get_observation(), {}
+
+    def _get_observation(self):
+        with phase("encode_observation"):
+            if self.observation_mode == "compact":
+                return self.features.encode(self.available, self.roster_counts, [self.current_pick])[0]
+            # Callers keep observations around, so hand out copies of the buffers
+            return {key: value.copy() for key, value in self._observation.items()}
+
+    def _draft(self, index):
+        """Mark a player drafted: swap-remove from the free list in O(1)."""
+        self.features.record_pick(0, index)
+        self.available[index] = False
+        self._observation["available_players"][index] = 0
+        slot = self._free_slot[index]
+        last = self._free[self._num_free - 1]
+        self._free[slot] = last
+        self._free_slot[last] = slot
+        self._num_free -= 1
+
+    def action_masks(self):
+        """Legal picks: still available and the position is under its limit."""
+        return self.available & (self.roster_counts < LIMITS)[self.pool.position]
+
+    def is_legal(self, action):
+        code = self.pool.position[action]
+        return bool(self.available[action]) and self.roster_counts[code] < LIMITS[code]
+
+    def _dropoff_bonus(self, index):
+        """Dropoff of the player's position if they come from its best remaining tier."""
+        code = self.pool.position[index]
+        if self.tracker.tier[index] != self.tracker.current_tier()[0, code]:
+            return 0.0
+        return max(float(self.tracker.dropoff()[0, code]), 0.0)
+
+    def _opponent_pick(self):
+        if self.opponent_mode == "scarcity":
+            return self.tracker.scarcity_pick(self.np_random, 0, self.available)
+        return self._free[self.np_random.integers(self._num_free)]
+
+    def step(self, action):
+        """Execute the agent's pick and simulate opponents' picks."""
+        with phase("env_step"):
+            action = int(action)
+            reward = self.invalid_action_penalty
+            if self.is_legal(action):
+                reward = float(self.pool.fpts[action])
+                if self.dropoff_reward_weight:
+                    reward += self.dropoff_reward_weight * self._dropoff_bonus(action)
+                self._draft(action)
+                self.agent_roster.append(action)
+                code = self.pool.position[action]
+                self.roster_counts[code] += 1
+                self._observation["agent_roster"][code] += 1
+
+            # Simulate opponent picks
+            with phase("opponent_picks"):
+                for _ in range(self.num_teams - 1):
+                    if self._num_free == 0:
+                        break
+                    self._draft(self._opponent_pick())
+
+            # Update draft state
+            self.current_pick += 1
+            terminated = self.current_pick >= self.roster_size or self._num_free == 0
+            return self._get_observation(), reward, terminated, False, {}
+
+    def render(self, mode="human"):
+        """Render the agent's current roster."""
+        print("Agent's Roster:")
+        for index in self.agent_roster:
+            print(f"{self.pool.player_name[index]} - {POSITIONS[self.pool.position[index]]} - {self.pool.fpts[index]} points")
@@ -0,0 +1,100 @@
+import numpy as np
+from gymnasium import spaces
+
+from utility.constants import POSITIONS
+from utility.draft_engine import LIMITS, STARTERS
+from utility.scarcity import NUM_TIERS, ScarcityTracker
+
+# Best-ADP available players shown per position
+TOP_AVAILABLE = {"QB": 8, "RB": 24, "WR": 24, "TE": 8, "K": 4, "DST": 4}
+# Scales that keep points and pick numbers roughly within [-3, 3]
+POINTS_SCALE = 100.0
+PICK_SCALE = 100.0
+
+TOP_COUNTS = np.array([TOP_AVAILABLE[pos] for pos in POSITIONS])
+# Feature slot where each position's top-available block starts (last entry is the total)
+TOP_OFFSETS = np.concatenate([[0], np.cumsum(TOP_COUNTS)])
+
+
+class DraftFeatures:
+    """Fixed-size, season-agnostic encoding of one or more drafts on a pool.
+
+    Per step the vector holds, for every position: VOR and ADP-vs-pick of
+    the best available players, how much of each ADP tier is left, scarcity
+    and tier dropoff; plus the team's roster fill, unmet starter needs and
+    draft progress. Tier figures come from a ScarcityTracker updated on each
+    pick; top-available lookups only scan the head of each position's ADP
+    list. Every array is indexed by draft row, so one encoder serves a
+    single env (one row) or a batched env.
+    """
+
+    def __init__(self, pool, num_drafts=1, num_teams=10, roster_size=8):
+        self.pool = pool
+        self.num_teams = num_teams
+        self.roster_size = roster_size
+        self.tracker = ScarcityTracker(pool, num_drafts)
+        self.drafted = np.zeros(num_drafts, dtype=np.int64)
+
+        self.num_features = 2 * TOP_OFFSETS[-1] + len(POSITIONS) * (NUM_TIERS + 4) + 2
+        self.observation_space = spaces.Box(low=-np.inf, high=np.inf, shape=(self.num_features,), dtype=np.float32)
+
+    def reset(self, rows=slice(None)):
+        self.tracker.reset(rows)
+        self.drafted[rows] = 0
+
+    def record(self, rows, indices):
+        """Account for players ``indices`` drafted in draft ``rows``."""
+        self.tracker.record(rows, indices)
+        np.add.at(self.drafted, np.asarray(rows), 1)
+
+    def record_pick(self, row, index):
+        """``record`` for a single pick."""
+        self.tracker.record_pick(row, index)
+        self.drafted[row] += 1
+
+    def _top_available(self, available):
+        """Each row's best-ADP available players at every position, in one pass.
+
+        Returns (rows, slots, players): player ``players[i]`` fills feature
+        slot ``slots[i]`` of draft ``rows[i]``; missing slots stay empty.
+        """
+        # The top N available at a position sit within N + (players taken) of its list head
+        tracker = self.tracker
+        lengths = np.minimum(tracker.position_sizes, TOP_COUNTS + tracker.taken().max(axis=0))
+        head = np.concatenate([indices[:length] for indices, length in zip(tracker.by_position, lengths)])
+        segment = np.repeat(np.arange(len(POSITIONS)), lengths)
+        starts = np.cumsum(lengths) - lengths
+
+        # Rank of each available player within its position's head
+        head_available = available[:, head]
+        seen = np.cumsum(head_available, axis=1)
+        before = np.concatenate([np.zeros((len(seen), 1), dtype=seen.dtype), seen], axis=1)[:, starts]
+        rank = seen - before[:, segment]
+        rows, cols = np.nonzero(head_available & (rank <= TOP_COUNTS[segment]))
+        slots = TOP_OFFSETS[segment[cols]] + rank[rows, cols] - 1
+        return rows, slots, head[cols]
+
+    def encode(self, available, roster_counts, current_pick) -> np.ndarray:
+        """Feature matrix (drafts x num_features) for the given draft rows' state."""
+        available = np.atleast_2d(available)
+        roster_counts = np.atleast_2d(roster_counts)
+        features = np.zeros((len(available), self.num_features), dtype=np.float32)
+        width = TOP_OFFSETS[-1]
+
+        rows, slots, players = self._top_available(available)
+        features[rows, slots] = self.pool.vor[players] / POINTS_SCALE
+        features[rows, width + slots] = (self.pool.adp_rank[players] - self.drafted[rows] - 1) / PICK_SCALE
+
+        column = 2 * width
+        for block in (
+            self.tracker.tier_depth().reshape(len(features), -1),
+            self.tracker.scarcity(),
+            self.tracker.dropoff() / POINTS_SCALE,
+            roster_counts / LIMITS,
+            np.maximum(STARTERS - roster_counts, 0) / np.maximum(STARTERS, 1),
+            np.asarray(current_pick, dtype=np.float64)[:, None] / self.roster_size,
+            self.drafted[:, None] / (self.num_teams * self.roster_size),
+        ):
+            features[:, column:column + block.shape[1]] = block
+            column += block.shape[1]
+        return features
@@ -0,0 +1,211 @@
+import random
+
+import numpy as np
+from gymnasium import spaces
+from stable_baselines3.common.vec_env import VecEnv
+
+from utility.constants import POSITIONS
+from utility.draft_engine import LIMITS
+from utility.draft_env import DraftPool
+from utility.draft_features import DraftFeatures
+from utility.player_pool import available_years
+from utility.profiler import phase
+
+
+class DraftVecEnv(VecEnv):
+    """K independent drafts against random or scarcity-driven opponents, stepped as one batch.
+
+    Implements the stable-baselines3 ``VecEnv`` interface natively: every
+    draft shares the season's ``DraftPool`` and its state is a row of
+    (num_envs x players) and (num_envs x positions) arrays, so the agent's
+    picks, opponent picks, rewards and masks for all drafts are a handful of
+    NumPy calls per step instead of a Python loop over environments.
+    Finished drafts are reset automatically, as SB3 expects. Illegal picks
+    are wasted and earn ``invalid_action_penalty``, and ``observation_mode``
+    picks the compact feature vector or the per-player dict, and
+    ``opponent_mode`` / ``dropoff_reward_weight`` behave as in
+    DraftEnvironment.
+    """
+
+    render_modes = []
+
+    def __init__(self, num_envs=256, num_teams=10, roster_size=8, year=None, seed=None, pool=None,
+                 invalid_action_penalty=0.0, observation_mode="compact", opponent_mode="random",
+                 dropoff_reward_weight=0.0):
+        # Every draft in the batch uses the same season's pool
+        if pool is None:
+            if year is None:
+                year = random.choice(available_years())
+            pool = DraftPool(year)
+        self.pool = pool
+        self.year = self.pool.year
+        self.num_teams = num_teams
+        self.roster_size = roster_size
+        self.invalid_action_penalty = invalid_action_penalty
+        self.observation_mode = observation_mode
+        self.opponent_mode = opponent_mode
+        self.dropoff_reward_weight = dropoff_reward_weight
+
+        self.features = DraftFeatures(self.pool, num_envs, num_teams, roster_size)
+        self.tracker = self.features.tracker
+        if observation_mode == "compact":
+            observation_space = self.features.observation_space
+        else:
+            observation_space = spaces.Dict({
+                "available_players": spaces.Box(low=0, high=1, shape=(self.pool.size,), dtype=np.float32),
+                "agent_roster": spaces.Box(low=0, high=roster_size, shape=(len(POSITIONS),), dtype=np.float32),
+            })
+        action_space = spaces.Discrete(self.pool.size)
+        # Set before VecEnv.__init__, which reads it back through get_attr
+        self.render_mode = None
+        super().__init__(num_envs, observation_space, action_space)
+
+        # Preallocated batch state, one row per draft
+        self.available = np.zeros((num_envs, self.pool.size), dtype=bool)
+        self.roster_counts = np.zeros((num_envs, len(POSITIONS)), dtype=np.int64)
+        self.current_pick = np.zeros(num_envs, dtype=np.int64)
+        self._rows = np.arange(num_envs)
+        self._rng = np.random.default_rng(seed)
+        self._actions = None
+        self._reset_rows(self._rows)
+        self._reset_observation = self._get_observation_rows(self._get_observation(), 0)
+
+    def _reset_rows(self, rows):
+        self.available[rows, :self.pool.num_players] = True
+        self.roster_counts[rows] = 0
+        self.current_pick[rows] = 0
+        self.features.reset(rows)
+
+    def _get_observation(self):
+        with phase("encode_observation"):
+            if self.observation_mode == "compact":
+                return self.features.encode(self.available, self.roster_counts, self.current_pick)
+            return {
+                "available_players": self.available.astype(np.float32),
+                "agent_roster": self.roster_counts.astype(np.float32),
+            }
+
+    def reset(self):
+        """Reset every draft and return the batched observation."""
+        if self._seeds[0] is not None:
+            self._rng = np.random.default_rng(self._seeds[0])
+        self._reset_seeds()
+        self._reset_options()
+        self._reset_rows(self._rows)
+        return self._get_observation()
+
+    def step_async(self, actions):
+        self._actions = np.asarray(actions, dtype=np.int64).reshape(self.num_envs)
+
+    def _scarcity_opponent_picks(self):
+        """Each opponent takes the best-ADP player at a position drawn by quality players left."""
+        for _ in range(self.num_teams - 1):
+            rows = np.flatnonzero(self.available.any(axis=1))
+            if not len(rows):
+                return
+            codes = self.tracker.sample_positions(self._rng, rows)
+            picked = self.tracker.best_available(self.available, rows, codes)
+            self.available[rows, picked] = False
+            self.features.record(rows, picked)
+
+    def _opponent_picks(self):
+        """Draw num_teams - 1 distinct available players per draft, uniformly.
+
+        Random keys are ranked per row with drafted players pushed to the
+        end, so the smallest keys are a uniform sample without replacement.
+        """
+        picks = min(self.num_teams - 1, self.pool.size)
+        if picks <= 0:
+            return
+        keys = self._rng.random(self.available.shape)
+        keys[~self.available] = np.inf
+        chosen = np.argpartition(keys, picks - 1, axis=1)[:, :picks]
+        # Rows with fewer free players than picks only take what is left
+        taken = np.isfinite(np.take_along_axis(keys, chosen, axis=1))
+        rows = np.broadcast_to(self._rows[:, None], chosen.shape)
+        self.available[rows[taken], chosen[taken]] = False
+        self.features.record(rows[taken], chosen[taken])
+
+    def step_wait(self):
+        with phase("env_step"):
+            actions = self._actions
+            # Agent picks; an illegal pick is wasted and penalised
+            positions = self.pool.position[actions]
+            valid = self.available[self._rows, actions] & (self.roster_counts[self._rows, positions] < LIMITS[positions])
+            rewards = np.where(valid, self.pool.fpts[actions], self.invalid_action_penalty)
+            if self.dropoff_reward_weight:
+                # Bonus for taking a player from the position's best remaining tier
+                best_tier = self.tracker.current_tier()[self._rows, positions] == self.tracker.tier[actions]
+                dropoff = np.maximum(self.tracker.dropoff()[self._rows, positions], 0.0)
+                rewards = rewards + np.where(valid & best_tier, self.dropoff_reward_weight * dropoff, 0.0)
+            rewards = rewards.astype(np.float32)
+            rows, picked = self._rows[valid], actions[valid]
+            self.available[rows, picked] = False
+            self.roster_counts[rows, positions[valid]] += 1
+            self.features.record(rows, picked)
+
+            with phase("opponent_picks"):
+                if self.opponent_mode == "scarcity":
+                    self._scarcity_opponent_picks()
+                else:
+                    self._opponent_picks()
+
+            # Update draft state
+            self.current_pick += 1
+            dones = (self.current_pick >= self.roster_size) | ~self.available.any(axis=1)
+            observation = self._get_observation()
+            infos = [{} for _ in range(self.num_envs)]
+            finished = np.flatnonzero(dones)
+            if len(finished):
+                terminal = self._get_observation_rows(observation, finished)
+                for i, row in enumerate(finished):
+                    infos[row]["terminal_observation"] = self._get_observation_rows(terminal, i)
+                    infos[row]["TimeLimit.truncated"] = False
+                # A freshly reset draft always has the same observation
+                self._reset_rows(finished)
+                self._set_observation_rows(observation, finished, self._reset_observation)
+            return observation, rewards, dones, infos
+
+    @staticmethod
+    def _get_observation_rows(observation, rows):
+        if isinstance(observation, dict):
+            return {key: value[rows].copy() for key, value in observation.items()}
+        return observation[rows].copy()
+
+    @staticmethod
+    def _set_observation_rows(observation, rows, values):
+        if isinstance(observation, dict):
+            for key in observation:
+                observation[key][rows] = values[key]
+        else:
+            observation[rows] = values
+
+    def action_masks(self):
+        """Legal picks per draft, shape (num_envs, players): available and under POSITION_LIMITS."""
+        return self.available & (self.roster_counts < LIMITS)[:, self.pool.position]
+
+    def seed(self, seed=None):
+        # One generator drives every draft in the batch
+        self._rng = np.random.default_rng(seed)
+        return [seed]
+
+    def close(self):
+        pass
+
+    def get_attr(self, attr_name, indices=None):
+        value = getattr(self, attr_name)
+        return [value for _ in self._get_indices(indices)]
+
+    def set_attr(self, attr_name, value, indices=None):
+        setattr(self, attr_name, value)
+
+    def env_method(self, method_name, *method_args, indices=None, **method_kwargs):
+        """Call a method once for the batch and split per-draft results by row."""
+        result = getattr(self, method_name)(*method_args, **method_kwargs)
+        indices = list(self._get_indices(indices))
+        if isinstance(result, np.ndarray) and result.shape[:1] == (self.num_envs,):
+            return [result[i] for i in indices]
+        return [result for _ in indices]
+
+    def env_is_wrapped(self, wrapper_class, indices=None):
+        return [False for _ in self._get_indices(indices)]
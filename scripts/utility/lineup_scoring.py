@@ -0,0 +1,176 @@
+import numpy as np
+import pandas as pd
+
+from utility.profiler import phase
+from utility.replacement_levels import load_replacement_index, waiver_points
+
+# Starting lineup: (slot, position, rank within the team's position by fpts)
+STARTER_SLOTS = [
+    ("QB1", "QB", 0),
+    ("RB1", "RB", 0),
+    ("RB2", "RB", 1),
+    ("WR1", "WR", 0),
+    ("WR2", "WR", 1),
+    ("TE1", "TE", 0),
+    ("K1", "K", 0),
+    ("DST1", "DST", 0),
+]
+FLEX_EXCLUDED = ["QB", "DST"]
+LINEUP_SLOTS = [slot for slot, _, _ in STARTER_SLOTS] + ["Flex1"]
+
+# Waiver column per position
+WAIVER_COLUMNS = {
+    "QB": "qb_waiver_fpts",
+    "WR": "wr_waiver_fpts",
+    "RB": "rb_waiver_fpts",
+    "TE": "te_waiver_fpts",
+    "K": "k_waiver_fpts",
+    "DST": "dst_waiver_fpts",
+}
+
+# Waiver floor per starter slot: (slot, waiver column, replacement name)
+WAIVER_SLOTS = [
+    ("QB1", "qb_waiver_fpts", "waiver_qb"),
+    ("RB1", "rb_waiver_fpts", "waiver_rb"),
+    ("RB2", "rb_waiver_fpts", "waiver_rb"),
+    ("WR1", "wr_waiver_fpts", "waiver_wr"),
+    ("WR2", "wr_waiver_fpts", "waiver_wr"),
+    ("TE1", "te_waiver_fpts", "waiver_te"),
+    ("K1", "k_waiver_fpts", "waiver_k"),
+    ("DST1", "dst_waiver_fpts", "waiver_dst"),
+]
+
+
+# Waiver column dtypes, decided once per process
+_waiver_dtypes = {}
+
+
+def season_waiver_points(year):
+    """Waiver floor per position for a season, from the replacement-level index."""
+    return {column: waiver_points(year, position) for position, column in WAIVER_COLUMNS.items()}
+
+
+def waiver_dtypes():
+    """Dtype of every waiver column in the fantasy ranking, decided once over all indexed seasons.
+
+    Integer-valued columns are int64 (except DST), as they were when the
+    values were written into a zero-initialised frame season by season.
+    Deciding over every season rather than the ones a run drew keeps the
+    vectorized scorer and the row-wise standings writer in step.
+    """
+    if not _waiver_dtypes:
+        seasons = sorted({year for year, _, _ in load_replacement_index()})
+        by_season = [season_waiver_points(year) for year in seasons]
+        for column in WAIVER_COLUMNS.values():
+            values = np.array([points[column] for points in by_season], dtype=np.float64)
+            integral = column != 'dst_waiver_fpts' and np.all(np.mod(values, 1) == 0)
+            _waiver_dtypes[column] = np.int64 if integral else np.float64
+    return _waiver_dtypes
+
+
+def typed_waiver_points(points):
+    """A season's waiver floors as int or float per ``waiver_dtypes``, for row-wise writers."""
+    dtypes = waiver_dtypes()
+    return {column: int(value) if dtypes.get(column) is np.int64 else float(value)
+            for column, value in points.items()}
+
+
+def _waiver_column(column, years, values_by_year):
+    """Broadcast per-season waiver values to teams."""
+    values = pd.Series(values_by_year, dtype=np.float64)
+    return values.reindex(years).to_numpy().astype(waiver_dtypes()[column])
+
+
+def pick_lineups(draft_results_df) -> pd.DataFrame:
+    """Pick every team's starters and flex from the draft results.
+
+    Sorts all picks once by (trial, team, fpts desc) and ranks players
+    within each position, so each slot is a single array lookup instead of
+    a per-team filter. Teams come out in groupby order.
+    """
+    df = draft_results_df.reset_index(drop=True)
+    trial_codes, trials = pd.factorize(df['trial_number'], sort=True)
+    team_codes, teams = pd.factorize(df['team_name'], sort=True)
+    team_keys = trial_codes.astype(np.int64) * len(teams) + team_codes
+    unique_keys, team_index = np.unique(team_keys, return_inverse=True)
+
+    # Best fpts first within each team, NaN last, earlier pick wins ties
+    fpts = df['fpts'].to_numpy(dtype=np.float64)
+    fpts_key = np.where(np.isnan(fpts), np.inf, -fpts)
+    order = np.lexsort((fpts_key, team_index))
+    positions = df['position'].to_numpy(dtype=object)[order]
+    slot_team = team_index[order]
+    position_rank = pd.DataFrame({'team': slot_team, 'position': positions}).groupby(
+        ['team', 'position'], sort=False).cumcount().to_numpy()
+
+    num_teams = len(unique_keys)
+    names = df['player_name'].to_numpy(dtype=object)[order]
+    sorted_fpts = np.nan_to_num(fpts[order], nan=0.0)
+    first_rows = np.unique(team_index, return_index=True)[1]
+    lineups = {
+        'year': df['year'].to_numpy()[first_rows],
+        'trial_number': trials.to_numpy()[unique_keys // len(teams)],
+        'team_name': teams.to_numpy()[unique_keys % len(teams)],
+    }
+
+    is_starter = np.zeros(len(df), dtype=bool)
+    for slot, position, rank in STARTER_SLOTS:
+        rows = np.flatnonzero((positions == position) & (position_rank == rank))
+        is_starter[rows] = True
+        slot_names = np.full(num_teams, None, dtype=object)
+        slot_fpts = np.zeros(num_teams)
+        slot_names[slot_team[rows]] = names[rows]
+        slot_fpts[slot_team[rows]] = sorted_fpts[rows]
+        lineups[slot] = slot_names
+        lineups[f'{slot}_fpts'] = slot_fpts
+
+    # Flex: best remaining non-QB, non-DST player on the team
+    candidates = np.flatnonzero(~is_starter & ~np.isin(positions, FLEX_EXCLUDED))
+    flex_teams, first = np.unique(slot_team[candidates], return_index=True)
+    rows = candidates[first]
+    flex_names = np.full(num_teams, None, dtype=object)
+    flex_fpts = np.zeros(num_teams)
+    flex_names[flex_teams] = names[rows]
+    flex_fpts[flex_teams] = sorted_fpts[rows]
+    lineups['Flex1'] = flex_names
+    lineups['Flex1_fpts'] = flex_fpts
+
+    return pd.DataFrame(lineups)
+
+
+def apply_waivers(fantasy_ranking_df, waiver_points_by_year):
+    """Attach waiver floors and replace starters that score below them."""
+    years = fantasy_ranking_df['year'].to_numpy()
+    waiver_columns = list(next(iter(waiver_points_by_year.values())))
+    for column in waiver_columns:
+        values_by_year = {year: points[column] for year, points in waiver_points_by_year.items()}
+        fantasy_ranking_df[column] = _waiver_column(column, years, values_by_year)
+
+    for slot, column, replacement in WAIVER_SLOTS:
+        waiver = fantasy_ranking_df[column].to_numpy()
+        below = waiver > fantasy_ranking_df[f'{slot}_fpts'].to_numpy()
+        fantasy_ranking_df.loc[below, f'{slot}_fpts'] = waiver[below]
+        fantasy_ranking_df.loc[below, slot] = replacement
+    return fantasy_ranking_df
+
+
+def rank_teams(fantasy_ranking_df):
+    """Total the lineup and rank teams within each trial."""
+    fpts_columns = [f'{slot}_fpts' for slot in LINEUP_SLOTS]
+    total_fpts = pd.to_numeric(fantasy_ranking_df[fpts_columns].sum(axis=1), errors='coerce')
+    fantasy_ranking_df['total_fpts'] = total_fpts.fillna(0).replace([float('inf'), -float('inf')], 0)
+    fantasy_ranking_df['rank'] = fantasy_ranking_df.groupby('trial_number')['total_fpts'].rank(ascending=False).astype(int)
+    return fantasy_ranking_df
+
+
+def score_draft_results(draft_results_df) -> pd.DataFrame:
+    """Build the fantasy ranking table from draft results."""
+    if 'year' not in draft_results_df.columns:
+        raise ValueError("'year' column is missing in the draft results file.")
+    with phase("pick_lineups"):
+        fantasy_ranking_df = pick_lineups(draft_results_df)
+    with phase("apply_waivers"):
+        waiver_points_by_year = {year: season_waiver_points(year) for year in fantasy_ranking_df['year'].unique()}
+        fantasy_ranking_df = apply_waivers(fantasy_ranking_df, waiver_points_by_year)
+    with phase("rank_teams"):
+        return rank_teams(fantasy_ranking_df)
@@ -0,0 +1,87 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Iterator, List, Sequence
+
+import numpy as np
+
+from utility import profiler
+
+
+def trial_seed(master_seed: int, trial_number: int) -> int:
+    """Derive the seed of one trial from the master seed.
+
+    The seed depends only on (master_seed, trial_number), never on which
+    worker runs the trial or in which order, so results are reproducible
+    for any worker count or chunk size.
+    """
+    sequence = np.random.SeedSequence(master_seed, spawn_key=(trial_number,))
+    return int(sequence.generate_state(1, dtype=np.uint64)[0])
+
+
+def run_trial_chunk(simulate: Callable, trials: Sequence[int], master_seed: int):
+    """Run a chunk of trials in the current process.
+
+    ``simulate`` returns either a list of records or a dict of record lists
+    (one per output table); the chunk result has the same shape.
+    """
+    results = None
+    for trial_number in trials:
+        rng = np.random.default_rng(trial_seed(master_seed, trial_number))
+        trial_results = simulate(trial_number, rng)
+        if isinstance(trial_results, dict):
+            results = results or {table: [] for table in trial_results}
+            for table, records in trial_results.items():
+                results[table].extend(records)
+        else:
+            results = results or []
+            results.extend(trial_results)
+    return results
+
+
+def chunk_trials(trials: Sequence[int], chunk_size: int) -> List[Sequence[int]]:
+    return [trials[i:i + chunk_size] for i in range(0, len(trials), chunk_size)]
+
+
+def run_trials(simulate: Callable, trials: Sequence[int], master_seed: int,
+               workers=None, chunk_size=25) -> Iterator:
+    """Run ``simulate(trial_number, rng)`` for every trial across a process pool.
+
+    ``rng`` is a NumPy Generator seeded by ``trial_seed``.
+
+    Yields the pick records of each chunk in trial order. ``simulate`` must be
+    a module-level function so it can be pickled to the workers. While the
+    profiler is enabled, workers record phases too and their counters are
+    merged into this process's report.
+    """
+    workers = workers or os.cpu_count()
+    chunks = chunk_trials(list(trials), chunk_size)
+    run_chunk = partial(run_trial_chunk, simulate, master_seed=master_seed)
+
+    if workers == 1:
+        for chunk in chunks:
+            yield run_chunk(chunk)
+        return
+
+    profile_settings = profiler.settings()
+    if profile_settings is not None:
+        run_chunk = partial(profiler.collect, profile_settings, run_chunk)
+
+    def result(future):
+        if profile_settings is None:
+            return future.result()
+        chunk_results, phase_stats = future.result()
+        profiler.merge(phase_stats)
+        return chunk_results
+
+    # Keep a bounded number of chunks in flight so finished results never
+    # pile up faster than the caller consumes them
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(run_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield result(pending.popleft())
+        while pending:
+            yield result(pending.popleft())
@@ -0,0 +1,70 @@
+import os
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from utility.constants import PBP_DIR
+
+# Play-by-play columns each scraper reads
+OFFENSE_COLUMNS = [
+    "game_id", "play_id", "week", "play_type",
+    "passer_player_id", "passer_player_name", "rusher_player_id", "rusher_player_name",
+    "receiver_player_id", "receiver_player_name", "kicker_player_id", "kicker_player_name",
+    "fumbled_1_player_id", "kickoff_returner_player_id", "punt_returner_player_id",
+    "pass_touchdown", "rush_touchdown", "touchdown", "return_touchdown",
+    "passing_yards", "rushing_yards", "receiving_yards",
+    "complete_pass", "pass_attempt", "interception", "fumble_lost",
+    "kick_distance", "field_goal_result", "extra_point_result",
+    "two_point_attempt", "two_point_conv_result",
+]
+DEFENSE_COLUMNS = [
+    "season", "week", "play_type", "posteam", "defteam", "td_team",
+    "return_touchdown", "field_goal_result", "extra_point_result", "two_point_conv_result",
+    "fumble_lost", "fumble_recovery_1_team", "yards_gained",
+    "interception", "sack", "safety", "punt_blocked",
+]
+# Everything the store keeps per season: the union of the scrapers' columns
+STORE_COLUMNS = sorted(set(OFFENSE_COLUMNS) | set(DEFENSE_COLUMNS))
+
+
+def pbp_path(year, directory: Path = PBP_DIR) -> Path:
+    return Path(directory) / f"pbp_{year}.parquet"
+
+
+def fetch_pbp(year) -> pd.DataFrame:
+    """Download one season of play-by-play, projected to STORE_COLUMNS."""
+    import nfl_data_py as nfl
+    return nfl.import_pbp_data([year], columns=STORE_COLUMNS)
+
+
+def write_pbp(year, pbp_data: pd.DataFrame, directory: Path = PBP_DIR) -> Path:
+    """Store a season's play-by-play (e.g. a fetched season or an offline fixture)."""
+    path = pbp_path(year, directory)
+    os.makedirs(path.parent, exist_ok=True)
+    columns = [col for col in STORE_COLUMNS if col in pbp_data.columns]
+    # Write then rename so a reader never sees a half-written file
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    pbp_data[columns].reset_index(drop=True).to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+    return path
+
+
+def stored_columns(year, directory: Path = PBP_DIR) -> List[str]:
+    path = pbp_path(year, directory)
+    return pq.read_schema(path).names if path.exists() else []
+
+
+def load_pbp(year, columns: Optional[Iterable[str]] = None, directory: Path = PBP_DIR,
+             refresh=False, fetch=fetch_pbp) -> pd.DataFrame:
+    """One season of play-by-play from the local store, reading only ``columns``.
+
+    The season is fetched (and stored) only when it is missing, lacks a
+    requested column, or ``refresh`` is set; otherwise nothing is downloaded.
+    """
+    columns = list(columns) if columns is not None else None
+    missing = set(columns or STORE_COLUMNS) - set(stored_columns(year, directory))
+    if refresh or missing:
+        write_pbp(year, fetch(year), directory)
+    return pd.read_parquet(pbp_path(year, directory), columns=columns)
@@ -0,0 +1,86 @@
+from bisect import bisect_right
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from utility.constants import BOT_PROFILES, DEFAULT_BOT_PROFILE, MANAGER_PROFILES, NUM_MANAGERS, NUM_ROUNDS
+
+# Rounds a profile's weights apply to, inclusive, and the weights over the top-ADP window
+ProfileRanges = Sequence[Tuple[int, int, Sequence[float]]]
+
+# Samplers of the configured profiles, built once per process
+_samplers: List = []
+
+
+def round_weights(profile: ProfileRanges) -> List[np.ndarray]:
+    """Candidate weights of every round (index 0 unused), checking the ranges cover each round once."""
+    weights = [None] * (NUM_ROUNDS + 1)
+    for first, last, round_range_weights in profile:
+        for round_num in range(first, last + 1):
+            if not 1 <= round_num <= NUM_ROUNDS or weights[round_num] is not None:
+                raise ValueError(f"Bot profile rounds must cover 1-{NUM_ROUNDS} exactly once, got {first}-{last}")
+            weights[round_num] = np.asarray(round_range_weights, dtype=np.float64)
+    missing = [round_num for round_num in range(1, NUM_ROUNDS + 1) if weights[round_num] is None]
+    if missing:
+        raise ValueError(f"Bot profile has no weights for rounds {missing}")
+    return weights
+
+
+class PickSampler:
+    """Weighted choice among a bot's top-ADP candidates, from precomputed tables.
+
+    For every round the sampler keeps the window size and, per number of
+    candidates actually found (fewer than the window late in a position
+    list), the cumulative weights of those candidates scaled to end at 1.
+    Renormalizing over the candidates that remain is the same rule the
+    batched engine uses. A pick is then one bisect of a uniform draw.
+    """
+
+    def __init__(self, profile: ProfileRanges):
+        self.weights = round_weights(profile)
+        self.windows = [0] + [len(weights) for weights in self.weights[1:]]
+        self.tables = [None] + [
+            [None] + [(np.cumsum(weights[:count]) / weights[:count].sum()).tolist()
+                      for count in range(1, len(weights) + 1)]
+            for weights in self.weights[1:]
+        ]
+
+    def window(self, round_num) -> int:
+        return self.windows[round_num]
+
+    def choose(self, candidates: List[int], round_num, draw) -> int:
+        """Candidate picked by a uniform ``draw`` in [0, 1)."""
+        if not candidates:
+            raise ValueError(f"No candidates to pick from in round {round_num}")
+        return candidates[bisect_right(self.tables[round_num][len(candidates)], draw)]
+
+
+def load_samplers(profiles: Dict[str, ProfileRanges] = BOT_PROFILES,
+                  manager_profiles: Dict[int, str] = MANAGER_PROFILES,
+                  default=DEFAULT_BOT_PROFILE) -> List[PickSampler]:
+    """Sampler of every manager, indexed by manager number (index 0 unused)."""
+    by_name = {name: PickSampler(profiles[name]) for name in {default, *manager_profiles.values()}}
+    return [None] + [by_name[manager_profiles.get(manager, default)] for manager in range(1, NUM_MANAGERS + 1)]
+
+
+def default_samplers() -> List[PickSampler]:
+    """``load_samplers()`` for the profiles in constants, cached per process."""
+    if not _samplers:
+        _samplers.extend(load_samplers())
+    return _samplers
+
+
+def cumulative_tables(samplers: List[PickSampler]) -> Tuple[np.ndarray, np.ndarray]:
+    """Per (manager, round) window sizes and raw cumulative weights, for the batched engine.
+
+    Weights are zero-padded to the widest window of each round, so a
+    manager never draws past its own window.
+    """
+    windows = np.array([[0] * (NUM_ROUNDS + 1)] + [sampler.windows for sampler in samplers[1:]])
+    cum = np.zeros((len(samplers), NUM_ROUNDS + 1, windows.max()))
+    for manager, sampler in enumerate(samplers[1:], start=1):
+        for round_num in range(1, NUM_ROUNDS + 1):
+            weights = sampler.weights[round_num]
+            cum[manager, round_num, :len(weights)] = np.cumsum(weights)
+            cum[manager, round_num, len(weights):] = cum[manager, round_num, len(weights) - 1]
+    return windows, cum
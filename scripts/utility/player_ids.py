@@ -0,0 +1,99 @@
+import os
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from utility.cache import read_cache, write_cache
+from utility.constants import CACHE_DIR, DEFENSIVE_STATS_DIR, RESULTS_DIR
+from utility.data_store import read_table, store_sources
+
+REGISTRY_CACHE_VERSION = 1
+REGISTRY_CACHE_FILE = Path(CACHE_DIR) / "player_ids.pkl"
+# Side table mapping the player_code column of the draft results back to player ids
+LOOKUP_FILE = Path(RESULTS_DIR) / "player_ids.csv"
+
+# Registry built in this process
+_registry = []
+
+
+class PlayerRegistry:
+    """Dense int32 code for every player id and DST team abbreviation.
+
+    Codes are positions in the sorted list of every id the data files
+    mention, so every process building from the same files agrees on them.
+    Code -1 means unknown; lookup tables built by ``table`` keep a spare
+    last slot so indexing with -1 yields their fill value.
+    """
+
+    def __init__(self, player_ids):
+        self.player_ids = np.asarray(player_ids, dtype=object)
+        self._index = pd.Index(self.player_ids)
+
+    def __len__(self):
+        return len(self.player_ids)
+
+    def encode(self, player_ids) -> np.ndarray:
+        """int32 code of each id, -1 when the id is unknown or missing."""
+        return self._index.get_indexer(pd.Index(np.asarray(player_ids, dtype=object))).astype(np.int32)
+
+    def decode(self, codes) -> np.ndarray:
+        """Player id of each code, NaN for -1."""
+        return np.append(self.player_ids, np.nan)[np.asarray(codes)]
+
+    def table(self, codes, values, fill=np.nan) -> np.ndarray:
+        """Dense per-code lookup of ``values`` (a later duplicate code wins); index it with codes."""
+        values = np.asarray(values)
+        lookup = np.full(len(self) + 1, fill, dtype=np.result_type(values.dtype, np.asarray(fill).dtype))
+        codes = np.asarray(codes)
+        known = codes >= 0
+        lookup[codes[known]] = values[known]
+        return lookup
+
+    def bitmask(self, codes) -> np.ndarray:
+        """Membership mask over codes, the array form of ``set(player_ids)``."""
+        return self.table(codes, np.ones(len(codes), dtype=bool), fill=False)
+
+    def write_lookup(self, path: Path = LOOKUP_FILE):
+        os.makedirs(Path(path).parent, exist_ok=True)
+        pd.DataFrame({"player_code": np.arange(len(self), dtype=np.int32),
+                      "player_id": self.player_ids}).to_csv(path, index=False)
+
+
+def _source_ids(path: Path) -> np.ndarray:
+    columns = ["pa_team"] if Path(path).parent == Path(DEFENSIVE_STATS_DIR) else ["player_id"]
+    frame = read_table(path, columns=columns)
+    return frame[columns[0]].dropna().to_numpy(dtype=object) if len(frame.columns) else np.array([], dtype=object)
+
+
+def build_registry() -> PlayerRegistry:
+    ids = np.concatenate([_source_ids(path) for path in store_sources()])
+    return PlayerRegistry(np.sort(pd.unique(ids.astype(str))))
+
+
+def load_registry() -> PlayerRegistry:
+    """The registry for the current data files, from memory or an on-disk cache rebuilt when a file changes."""
+    if not _registry:
+        sources = store_sources()
+        registry = read_cache(REGISTRY_CACHE_FILE, REGISTRY_CACHE_VERSION, sources)
+        if registry is None:
+            registry = build_registry()
+            write_cache(REGISTRY_CACHE_FILE, REGISTRY_CACHE_VERSION, sources, registry)
+        _registry.append(registry)
+    return _registry[0]
+
+
+def read_lookup(path: Path = LOOKUP_FILE) -> Optional[PlayerRegistry]:
+    """Registry a results run was written with, if its side table exists."""
+    if not Path(path).exists():
+        return None
+    return PlayerRegistry(pd.read_csv(path, dtype={"player_id": str})["player_id"].to_numpy(dtype=object))
+
+
+def recode(codes, written_with: Optional[PlayerRegistry]) -> np.ndarray:
+    """Translate codes written under another registry into the current one."""
+    if written_with is None:
+        return np.asarray(codes, dtype=np.int32)
+    current = load_registry()
+    return np.append(current.encode(written_with.player_ids), -1).astype(np.int32)[np.asarray(codes)]
@@ -0,0 +1,107 @@
+import os
+import re
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from utility.cache import read_cache, write_cache
+from utility.constants import ADP_DIR, CACHE_DIR, DEFENSIVE_STATS_DIR, SEASONAL_STATS_DIR
+from utility.data_store import read_table
+from utility.player_ids import load_registry
+from utility.profiler import phase
+
+POOL_CACHE_VERSION = 2
+
+# Merged pools already built in this process, keyed by year
+_pools: Dict[int, pd.DataFrame] = {}
+_years: List[int] = []
+
+
+def load_file(folder, filename):
+    file_path = os.path.join(folder, filename)
+    if os.path.exists(file_path):
+        return read_table(file_path)
+    raise FileNotFoundError(f"File {filename} not found in folder {folder}")
+
+
+def extract_years(folder_path: Path) -> List[int]:
+    """Extract years from CSV file names."""
+    years = [int(re.match(r"^\d{4}", file.name).group())
+                for file in folder_path.glob("*.csv") if re.match(r"^\d{4}", file.name)]
+    return sorted(years)
+
+
+def available_years() -> List[int]:
+    """Seasons with an ADP file, read from disk once per process."""
+    if not _years:
+        _years.extend(extract_years(ADP_DIR))
+    return list(_years)
+
+
+def source_files(year) -> List[Path]:
+    """CSV files a season's player pool is built from."""
+    return [
+        Path(ADP_DIR) / f"{year}ADP.csv",
+        Path(SEASONAL_STATS_DIR) / f"player_stats_{year}.csv",
+        Path(DEFENSIVE_STATS_DIR) / f"seasonal_defensive_stats_{year}.csv",
+    ]
+
+
+def merge_stats(adp_df, seasonal_stats_df, defensive_stats_df):
+    """Merge season fppr and DST fpts into the ADP board as a single fpts column.
+
+    The joins go through the player registry: each stats file becomes a
+    dense lookup by player code, indexed with the board's codes.
+    """
+    registry = load_registry()
+    codes = registry.encode(adp_df["player_id"])
+    fppr = registry.table(registry.encode(seasonal_stats_df["player_id"]), seasonal_stats_df["fppr"])
+    def_fpts = registry.table(registry.encode(defensive_stats_df["pa_team"]), defensive_stats_df["fpts"])
+    adp_df = adp_df.assign(fppr=fppr[codes], def_fpts=def_fpts[codes])
+    adp_df["fpts"] = np.where(adp_df["POSITION"] == "DST", adp_df["def_fpts"], adp_df["fppr"])
+    return adp_df
+
+
+def build_player_pool(year) -> pd.DataFrame:
+    """Load and merge one season from the CSVs, sorted by ADP (FPPRAVG)."""
+    adp_file, seasonal_file, defensive_file = source_files(year)
+    with phase("csv_load"):
+        adp_df = load_file(adp_file.parent, adp_file.name)
+        adp_df["year"] = year
+        seasonal_stats_df = load_file(seasonal_file.parent, seasonal_file.name)
+        defensive_stats_df = load_file(defensive_file.parent, defensive_file.name)
+    with phase("merge_stats"):
+        data_df = merge_stats(adp_df, seasonal_stats_df, defensive_stats_df)
+    return data_df.sort_values(by="FPPRAVG").reset_index(drop=True)
+
+
+def cache_path(year) -> Path:
+    return Path(CACHE_DIR) / f"player_pool_{year}.pkl"
+
+
+def load_player_pool(year) -> pd.DataFrame:
+    """Merged player pool for a season, sorted by ADP.
+
+    Built from the CSVs once, then served from memory and from an on-disk
+    cache under CACHE_DIR that is rebuilt when a source CSV changes. The
+    returned frame is shared: treat it as read-only.
+    """
+    year = int(year)
+    pool = _pools.get(year)
+    if pool is None:
+        pool = read_cache(cache_path(year), POOL_CACHE_VERSION, source_files(year))
+        if pool is None:
+            pool = build_player_pool(year)
+            write_cache(cache_path(year), POOL_CACHE_VERSION, source_files(year), pool)
+        # Codes depend on every data file, so they are attached per process rather than cached
+        pool["player_code"] = load_registry().encode(pool["player_id"])
+        _pools[year] = pool
+    return pool
+
+
+def clear_pool_cache():
+    """Drop the in-memory pools (the on-disk cache is left alone)."""
+    _pools.clear()
+    _years.clear()
@@ -0,0 +1,147 @@
+import numpy as np
+import pandas as pd
+
+# Field goal distance buckets, as (0, 39], (39, 49], (49, 59], (59, inf)
+FG_BINS = [0, 39, 49, 59, float("inf")]
+FG_RANGES = ["0-39", "40-49", "50-59", "60+"]
+
+# Per-player stat columns, in the order player_stats_{year}.csv has them
+STAT_COLUMNS = [
+    "pass_touchdown", "rush_touchdown", "rec_touchdown",
+    "passing_yards", "rushing_yards", "receiving_yards",
+    "receptions", "targets", "interception", "fumble_lost",
+    "two_point_pass_success", "two_point_rush_success", "two_point_rec_success",
+    "kick_return_touchdown", "punt_return_touchdown",
+    *[f"fg_made_{label}" for label in FG_RANGES],
+    *[f"fg_missed_{label}" for label in FG_RANGES],
+    "pat_made", "pat_missed",
+]
+STAT_INDEX = {stat: i for i, stat in enumerate(STAT_COLUMNS)}
+
+# Roles whose names are looked up, in priority order
+NAME_ROLES = ["passer", "rusher", "receiver", "kicker"]
+
+
+def _flag(pbp_data, column, value=1) -> np.ndarray:
+    return (pbp_data[column] == value).to_numpy()
+
+
+def _amount(pbp_data, column) -> np.ndarray:
+    return pbp_data[column].fillna(0).to_numpy(dtype=np.float64)
+
+
+def _two_point_successes(pbp_data) -> np.ndarray:
+    """Successful two-point plays, counting a (game_id, play_id) once."""
+    success = _flag(pbp_data, "two_point_attempt") & _flag(pbp_data, "two_point_conv_result", "success")
+    rows = np.flatnonzero(success)
+    repeated = pbp_data.iloc[rows].duplicated(subset=["game_id", "play_id"]).to_numpy()
+    success[rows[repeated]] = False
+    return success
+
+
+def role_stats(pbp_data):
+    """Each play's player roles with the stats they earn on it.
+
+    Yields (id column, member mask, {stat: per-play values}). A player is
+    listed on every play where their role's member mask is set, even when
+    the stat values there are zero, so the player set matches the per-stat
+    groupbys this replaces.
+    """
+    play_type = pbp_data["play_type"]
+    two_point = _two_point_successes(pbp_data)
+    pass_td = _flag(pbp_data, "pass_touchdown")
+    every_play = np.ones(len(pbp_data), dtype=bool)
+
+    yield "passer_player_id", every_play, {
+        "pass_touchdown": pass_td,
+        "passing_yards": _amount(pbp_data, "passing_yards"),
+        "interception": _amount(pbp_data, "interception"),
+        "two_point_pass_success": two_point,
+    }
+    yield "rusher_player_id", every_play, {
+        "rush_touchdown": _flag(pbp_data, "rush_touchdown"),
+        "rushing_yards": _amount(pbp_data, "rushing_yards"),
+        "two_point_rush_success": two_point,
+    }
+    yield "receiver_player_id", every_play, {
+        "rec_touchdown": _flag(pbp_data, "touchdown") & pass_td,
+        "receiving_yards": _amount(pbp_data, "receiving_yards"),
+        "receptions": _flag(pbp_data, "complete_pass"),
+        "targets": _flag(pbp_data, "pass_attempt"),
+        "two_point_rec_success": two_point,
+    }
+    fumble_lost = _flag(pbp_data, "fumble_lost")
+    yield "fumbled_1_player_id", fumble_lost, {"fumble_lost": fumble_lost}
+
+    # Kickers: field goals by distance bucket and PATs
+    fg_range = pd.cut(pbp_data["kick_distance"], bins=FG_BINS, labels=FG_RANGES).cat.codes.to_numpy()
+    field_goal = (play_type == "field_goal").to_numpy() & (fg_range >= 0)
+    fg_made = field_goal & _flag(pbp_data, "field_goal_result", "made")
+    fg_missed = field_goal & pbp_data["field_goal_result"].isin(["missed", "blocked"]).to_numpy()
+    extra_point = (play_type == "extra_point").to_numpy()
+    pat_made = extra_point & _flag(pbp_data, "extra_point_result", "good")
+    pat_missed = extra_point & pbp_data["extra_point_result"].isin(["failed", "blocked"]).to_numpy()
+    kicker_stats = {"pat_made": pat_made, "pat_missed": pat_missed}
+    for code, label in enumerate(FG_RANGES):
+        kicker_stats[f"fg_made_{label}"] = fg_made & (fg_range == code)
+        kicker_stats[f"fg_missed_{label}"] = fg_missed & (fg_range == code)
+    yield "kicker_player_id", fg_made | fg_missed | pat_made | pat_missed, kicker_stats
+
+    return_td = _flag(pbp_data, "return_touchdown")
+    kick_return_td = (play_type == "kickoff").to_numpy() & return_td
+    punt_return_td = (play_type == "punt").to_numpy() & return_td
+    yield "kickoff_returner_player_id", kick_return_td, {"kick_return_touchdown": kick_return_td}
+    yield "punt_returner_player_id", punt_return_td, {"punt_return_touchdown": punt_return_td}
+
+
+def aggregate_player_stats(pbp_data, by_week=False) -> pd.DataFrame:
+    """Season totals per player for every STAT_COLUMNS stat, in one reduction.
+
+    Each play's roles are melted into one long (player, stat, value) array
+    and summed with a single bincount. Players are sorted by player_id;
+    every stat is float, as the per-stat groupbys gave. With ``by_week``
+    the totals are per (player, week) instead, with a ``week`` column.
+    """
+    roles, role_ids, role_weeks = [], [], []
+    weeks = pbp_data["week"].to_numpy()
+    for id_column, member, role in role_stats(pbp_data):
+        player_ids = pbp_data[id_column].to_numpy()
+        member = member & pd.notna(player_ids)
+        roles.append((member, role))
+        role_ids.append(player_ids[member])
+        role_weeks.append(weeks[member])
+
+    # Every listed player gets a row; only non-zero stat values need summing
+    codes, player_ids = pd.factorize(np.concatenate(role_ids), sort=True)
+    if by_week:
+        week_codes, week_values = pd.factorize(np.concatenate(role_weeks), sort=True)
+        groups, codes = np.unique(codes * len(week_values) + week_codes, return_inverse=True)
+    role_codes = np.split(codes, np.cumsum([len(ids) for ids in role_ids])[:-1])
+    num_groups = len(groups) if by_week else len(player_ids)
+
+    keys, weights = [], []
+    for (member, role), group_codes in zip(roles, role_codes):
+        for stat, per_play in role.items():
+            values = np.asarray(per_play, dtype=np.float64)[member]
+            nonzero = values != 0
+            keys.append(group_codes[nonzero] * len(STAT_COLUMNS) + STAT_INDEX[stat])
+            weights.append(values[nonzero])
+
+    totals = np.bincount(np.concatenate(keys), weights=np.concatenate(weights),
+                         minlength=num_groups * len(STAT_COLUMNS))
+    stats_df = pd.DataFrame(totals.reshape(num_groups, len(STAT_COLUMNS)), columns=STAT_COLUMNS)
+    if by_week:
+        stats_df.insert(0, "week", np.asarray(week_values)[groups % len(week_values)])
+        stats_df.insert(0, "player_id", np.asarray(player_ids)[groups // len(week_values)])
+    else:
+        stats_df.insert(0, "player_id", player_ids)
+    return stats_df
+
+
+def player_names(pbp_data) -> pd.DataFrame:
+    """First name seen for each player id, preferring passer, then rusher, receiver and kicker roles."""
+    names = pd.DataFrame({
+        "player_id": np.concatenate([pbp_data[f"{role}_player_id"].to_numpy() for role in NAME_ROLES]),
+        "player_name": np.concatenate([pbp_data[f"{role}_player_name"].to_numpy() for role in NAME_ROLES]),
+    })
+    return names.drop_duplicates(subset=["player_id"])
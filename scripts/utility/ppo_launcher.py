@@ -0,0 +1,46 @@
+import os
+from functools import partial
+from typing import Dict, List
+
+import numpy as np
+from stable_baselines3.common.vec_env import SubprocVecEnv
+
+from utility.draft_env import DraftEnvironment
+from utility.player_pool import available_years
+from utility.shared_pool import attach_pool, publish_pools
+
+
+def make_env(pool_paths: Dict[int, str], year, seed, env_kwargs):
+    """Env factory run inside a worker: attach the shared pool for ``year``."""
+    env = DraftEnvironment(pool=attach_pool(pool_paths[year]), **env_kwargs)
+    env.reset(seed=seed)
+    return env
+
+
+def sample_worker_years(years: List[int], num_workers, seed=None) -> List[int]:
+    """One season per worker: round-robin when there are enough workers, else drawn at random."""
+    years = sorted(years)
+    if num_workers >= len(years):
+        return [years[rank % len(years)] for rank in range(num_workers)]
+    return [int(year) for year in np.random.default_rng(seed).choice(years, size=num_workers, replace=False)]
+
+
+def launch_envs(num_workers=None, seed=None, years=None, start_method=None, **env_kwargs) -> SubprocVecEnv:
+    """Start one DraftEnvironment per worker process over shared player pools.
+
+    With the compact observation every season shares one observation space,
+    so workers can draft different years under a single policy. The pools
+    are published once to memory-mapped files before the workers
+    start; each worker maps its season read-only instead of loading the CSVs.
+    Worker ``rank`` is seeded with ``seed + rank`` (unseeded when seed is None);
+    ``env_kwargs`` are passed on to every DraftEnvironment.
+    """
+    num_workers = num_workers or os.cpu_count()
+    years = years or available_years()
+    worker_years = sample_worker_years(years, num_workers, seed)
+    pool_paths = {year: str(path) for year, path in publish_pools(set(worker_years)).items()}
+    env_fns = [
+        partial(make_env, pool_paths, year, None if seed is None else seed + rank, env_kwargs)
+        for rank, year in enumerate(worker_years)
+    ]
+    return SubprocVecEnv(env_fns, start_method=start_method)
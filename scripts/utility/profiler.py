@@ -0,0 +1,193 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, Optional
+
+
+class _Disabled:
+    """Returned by ``phase`` while profiling is off, so instrumented code pays one call and a no-op with-block."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+
+_DISABLED = _Disabled()
+
+_settings: Optional[Dict] = None
+_stats: Dict[str, list] = {}  # phase -> [calls, seconds, peak bytes]
+_open = []  # per open phase: [traced bytes at entry, highest peak seen in nested phases]
+_target = {"profile": None, "snapshot": None, "worker_profiles": []}
+
+
+def enable(track_memory=False, target=None, target_mode="cprofile"):
+    """Start recording phases in this process.
+
+    ``track_memory`` runs tracemalloc to record each phase's peak traced
+    memory; it slows Python allocation, so wall times are best read from
+    a run without it. ``target`` names one phase to examine in depth: with
+    ``target_mode="cprofile"`` its calls are profiled, with "tracemalloc" a
+    snapshot is kept of its last call.
+    """
+    global _settings
+    _settings = {"track_memory": track_memory, "target": target, "target_mode": target_mode}
+    if (track_memory or (target and target_mode == "tracemalloc")) and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def disable():
+    global _settings
+    _settings = None
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def is_enabled() -> bool:
+    return _settings is not None
+
+
+def settings() -> Optional[Dict]:
+    return dict(_settings) if _settings else None
+
+
+def reset():
+    _stats.clear()
+    _open.clear()
+    _target.update(profile=None, snapshot=None, worker_profiles=[])
+
+
+class _ProfileStats:
+    """cProfile stats received from a worker, in the form ``pstats.Stats`` loads."""
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    def create_stats(self):
+        pass
+
+
+class _Phase:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        if tracemalloc.is_tracing():
+            # Peaks are per phase: restart the peak and remember the parent's so far
+            current, peak = tracemalloc.get_traced_memory()
+            if _open:
+                _open[-1][1] = max(_open[-1][1], peak)
+            tracemalloc.reset_peak()
+            _open.append([current, 0])
+        if self.name == _settings["target"] and _settings["target_mode"] == "cprofile":
+            _target["profile"] = _target["profile"] or cProfile.Profile()
+            _target["profile"].enable()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        is_target = self.name == _settings["target"]
+        if is_target and _settings["target_mode"] == "cprofile":
+            _target["profile"].disable()
+        peak = 0
+        if tracemalloc.is_tracing() and _open:
+            start, nested_peak = _open.pop()
+            peak = max(tracemalloc.get_traced_memory()[1], nested_peak)
+            if _open:
+                _open[-1][1] = max(_open[-1][1], peak)
+            peak -= start
+            if is_target and _settings["target_mode"] == "tracemalloc":
+                _target["snapshot"] = tracemalloc.take_snapshot()
+
+        stats = _stats.get(self.name)
+        if stats is None:
+            stats = _stats[self.name] = [0, 0.0, 0]
+        stats[0] += 1
+        stats[1] += elapsed
+        stats[2] = max(stats[2], peak)
+        return False
+
+
+def phase(name):
+    """Context manager timing a named phase; a shared no-op while profiling is disabled."""
+    if _settings is None:
+        return _DISABLED
+    return _Phase(name)
+
+
+def snapshot() -> Dict:
+    """Everything recorded so far in picklable form, for shipping from a worker process to the parent."""
+    profile = None
+    if _target["profile"] is not None:
+        _target["profile"].create_stats()
+        profile = _target["profile"].stats
+    return {"phases": {name: list(stats) for name, stats in _stats.items()},
+            "cprofile": profile, "tracemalloc": _target["snapshot"]}
+
+
+def merge(recorded: Dict):
+    """Fold a ``snapshot`` from another process into this one's counters."""
+    for name, (calls, seconds, peak) in recorded["phases"].items():
+        stats = _stats.setdefault(name, [0, 0.0, 0])
+        stats[0] += calls
+        stats[1] += seconds
+        stats[2] = max(stats[2], peak)
+    if recorded["cprofile"]:
+        _target["worker_profiles"].append(_ProfileStats(recorded["cprofile"]))
+    if recorded["tracemalloc"] is not None:
+        _target["snapshot"] = recorded["tracemalloc"]
+
+
+def collect(profile_settings, fn, *args):
+    """Run ``fn`` in a worker process with the parent's settings and return (result, ``snapshot()``).
+
+    Forked workers inherit the parent's counters, so they start from a reset.
+    """
+    enable(**profile_settings)
+    reset()
+    return fn(*args), snapshot()
+
+
+def report(top=25) -> Dict:
+    """Structured report: per-phase calls, total and mean wall time and peak memory, slowest first."""
+    phases = {
+        name: {
+            "calls": calls,
+            "total_s": seconds,
+            "mean_ms": seconds * 1e3 / calls if calls else 0.0,
+            "peak_mb": peak / 1e6 if _settings and _settings["track_memory"] else None,
+        }
+        for name, (calls, seconds, peak) in sorted(_stats.items(), key=lambda item: -item[1][1])
+    }
+    result = {"settings": settings(), "phases": phases}
+    profiles = [_target["profile"]] if _target["profile"] is not None else []
+    profiles += _target["worker_profiles"]
+    if profiles:
+        out = io.StringIO()
+        pstats.Stats(*profiles, stream=out).sort_stats("cumulative").print_stats(top)
+        result["cprofile"] = out.getvalue()
+    if _target["snapshot"] is not None:
+        result["tracemalloc"] = [str(stat) for stat in _target["snapshot"].statistics("lineno")[:top]]
+    return result
+
+
+def write_report(path: Path) -> Path:
+    """Write ``report()`` as JSON and print the phase table."""
+    result = report()
+    os.makedirs(Path(path).parent, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(result, f, indent=2)
+    for name, stats in result["phases"].items():
+        memory = f" {stats['peak_mb']:9.1f} MB" if stats["peak_mb"] is not None else ""
+        print(f"{name:<20} {stats['calls']:>9} calls {stats['total_s']:10.3f} s {stats['mean_ms']:10.3f} ms{memory}")
+    return Path(path)
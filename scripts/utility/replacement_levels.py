@@ -0,0 +1,106 @@
+import re
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from utility.cache import read_cache, write_cache
+from utility.constants import (
+    CACHE_DIR,
+    DEFENSIVE_STATS_DIR,
+    NUM_ROUNDS,
+    SEASONAL_STATS_DIR,
+    WAIVER_FACTORS,
+)
+from utility.data_store import read_table
+
+INDEX_CACHE_VERSION = 1
+INDEX_CACHE_FILE = Path(CACHE_DIR) / "replacement_index.pkl"
+
+# Scoring formats in the seasonal stats files; DST has a single fpts column
+OFFENSE_FORMATS = ["fppr", "hppr"]
+DST_FORMAT = "dst"
+
+_index = {}
+
+
+def _season_files(folder, pattern) -> Dict[int, Path]:
+    files = {}
+    for file in Path(folder).glob("*.csv"):
+        match = re.fullmatch(pattern, file.name)
+        if match:
+            files[int(match.group(1))] = file
+    return dict(sorted(files.items()))
+
+
+def index_sources() -> List[Path]:
+    """Seasonal offensive and defensive stats files the index is built from."""
+    return (list(_season_files(SEASONAL_STATS_DIR, r"player_stats_(\d{4})\.csv").values())
+            + list(_season_files(DEFENSIVE_STATS_DIR, r"seasonal_defensive_stats_(\d{4})\.csv").values()))
+
+
+def _sorted_desc(values) -> np.ndarray:
+    """Highest first with NaN last, like sort_values(ascending=False)."""
+    return -np.sort(-np.asarray(values, dtype=np.float64))
+
+
+def build_replacement_index() -> Dict[tuple, np.ndarray]:
+    """Sorted fpts per (season, format, position) from the stats CSVs."""
+    index = {}
+    for year, path in _season_files(SEASONAL_STATS_DIR, r"player_stats_(\d{4})\.csv").items():
+        stats_df = read_table(path)
+        positions = stats_df["position"].str.upper()
+        for position in positions.dropna().unique():
+            for fmt in OFFENSE_FORMATS:
+                index[(year, fmt, position)] = _sorted_desc(stats_df.loc[positions == position, fmt])
+    for year, path in _season_files(DEFENSIVE_STATS_DIR, r"seasonal_defensive_stats_(\d{4})\.csv").items():
+        index[(year, DST_FORMAT, "DST")] = _sorted_desc(read_table(path, columns=["fpts"])["fpts"])
+    return index
+
+
+def load_replacement_index() -> Dict[tuple, np.ndarray]:
+    """The replacement-level index, built once and cached under CACHE_DIR."""
+    if not _index:
+        sources = index_sources()
+        index = read_cache(INDEX_CACHE_FILE, INDEX_CACHE_VERSION, sources)
+        if index is None:
+            index = build_replacement_index()
+            write_cache(INDEX_CACHE_FILE, INDEX_CACHE_VERSION, sources, index)
+        _index.update(index)
+    return _index
+
+
+def _format_for(position, fmt):
+    return DST_FORMAT if position.upper() == "DST" else fmt
+
+
+def sorted_fpts(year, position, fmt="fppr") -> np.ndarray:
+    """Season fpts of every player at a position, best first."""
+    key = (int(year), _format_for(position, fmt), position.upper())
+    return load_replacement_index().get(key, np.empty(0))
+
+
+def waiver_points(year, position, factor=None, n=NUM_ROUNDS, fmt="fppr"):
+    """Fpts of the replacement-level player: the floor(n * factor)-th best at the position.
+
+    Returns 0 when the position has fewer players than that.
+    """
+    if factor is None:
+        factor = WAIVER_FACTORS[position.upper()]
+    fpts = sorted_fpts(year, position, fmt)
+    threshold_index = int(np.floor(n * factor)) - 1  # Convert to zero-based index
+    if threshold_index < len(fpts):
+        return fpts[threshold_index]
+    return 0
+
+
+def replacement_levels(year, n=NUM_ROUNDS, fmt="fppr") -> Dict[str, float]:
+    """Waiver floor of every lineup position for a season."""
+    return {position: waiver_points(year, position, n=n, fmt=fmt) for position in WAIVER_FACTORS}
+
+
+def value_over_replacement(year, positions, fpts, n=NUM_ROUNDS, fmt="fppr") -> np.ndarray:
+    """VOR of each player: fpts minus the replacement level of their position."""
+    levels = replacement_levels(year, n, fmt)
+    baseline = np.array([levels.get(position, 0) for position in positions], dtype=np.float64)
+    return np.asarray(fpts, dtype=np.float64) - baseline
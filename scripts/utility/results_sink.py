@@ -0,0 +1,96 @@
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from utility.constants import RESULTS_CHUNK_SIZE
+
+PART_PATTERN = "part-*.parquet"
+
+
+class ResultsSink:
+    """Streams draft result rows to numbered Parquet part files.
+
+    Rows are buffered until ``chunk_size`` is reached, then written as one
+    part file. Each part is written under a temporary name and renamed, so
+    every ``part-*.parquet`` on disk is complete even if the run dies, and
+    memory stays bounded by one chunk.
+
+    ``resume`` takes a ``state()`` recorded by a checkpoint: the first
+    ``parts`` part files are kept and numbering continues after them.
+    """
+
+    def __init__(self, directory, chunk_size=RESULTS_CHUNK_SIZE, resume: Optional[Dict] = None):
+        self.directory = Path(directory)
+        self.chunk_size = chunk_size
+        self.parts_written = resume["parts"] if resume else 0
+        self.rows_written = resume["rows"] if resume else 0
+        self._buffer: List[pd.DataFrame] = []
+        self._buffered_rows = 0
+
+        # Start from an empty directory (or the resumed parts) so old runs never mix in
+        os.makedirs(self.directory, exist_ok=True)
+        for part in self.directory.glob(PART_PATTERN):
+            if part.name >= self._part_name(self.parts_written):
+                part.unlink()
+
+    @staticmethod
+    def _part_name(number) -> str:
+        return f"part-{number:05d}.parquet"
+
+    def state(self) -> Dict:
+        """Counts of what is on disk, for resuming; call right after ``flush``."""
+        return {"directory": str(self.directory), "parts": self.parts_written, "rows": self.rows_written}
+
+    def write_records(self, records: List[Dict]):
+        if records:
+            self.write_frame(pd.DataFrame(records))
+
+    def write_frame(self, frame: pd.DataFrame):
+        self._buffer.append(frame)
+        self._buffered_rows += len(frame)
+        if self._buffered_rows >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Write everything buffered as one part file."""
+        if not self._buffer:
+            return
+        chunk = pd.concat(self._buffer, ignore_index=True)
+        part_path = self.directory / self._part_name(self.parts_written)
+        tmp_path = part_path.with_suffix(".tmp")
+        chunk.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, part_path)
+        self.parts_written += 1
+        self.rows_written += len(chunk)
+        self._buffer = []
+        self._buffered_rows = 0
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        # Keep what was produced before a failure readable
+        self.close()
+
+
+def result_parts(directory) -> List[Path]:
+    return sorted(Path(directory).glob(PART_PATTERN))
+
+
+def read_results(directory, columns=None) -> pd.DataFrame:
+    """Load every complete part written by a ResultsSink."""
+    parts = result_parts(directory)
+    if not parts:
+        raise FileNotFoundError(f"No result parts found in {directory}")
+    return pd.concat([pd.read_parquet(part, columns=columns) for part in parts], ignore_index=True)
+
+
+def export_csv(directory, output_file):
+    """Write the part files out as one CSV, one part in memory at a time."""
+    for i, part in enumerate(result_parts(directory)):
+        pd.read_parquet(part).to_csv(output_file, index=False, mode="w" if i == 0 else "a", header=i == 0)
@@ -0,0 +1,158 @@
+import numpy as np
+
+from utility.constants import NUM_MANAGERS, POSITIONS, STARTER_POSITIONS
+
+# Position-rank edges of the ADP tier buckets (QB1-6, QB7-12, ...)
+TIER_EDGES = np.array([6, 12, 24, 36, 60])
+NUM_TIERS = len(TIER_EDGES) + 1
+# Quality players: the top-ADP players the league needs as starters
+QUALITY_DEPTH = np.array([NUM_MANAGERS * STARTER_POSITIONS[pos] for pos in POSITIONS])
+
+
+class ScarcityTracker:
+    """Per-position scarcity, tier depth and dropoff for one or more drafts.
+
+    Tier boundaries come from each position's ADP order and are fixed once
+    per season. Each pick then only adjusts per-(draft, position, tier)
+    counters and fpts sums, so the queries below never rescan the pool.
+    Arrays are indexed by draft row, so a single env uses one row and a
+    batched env one row per draft.
+    """
+
+    def __init__(self, pool, num_drafts=1):
+        self.pool = pool
+        num_players = pool.num_players
+        position = pool.position[:num_players]
+
+        # Each position's players in ADP order, flattened with per-position offsets
+        self.by_position = []
+        position_rank = np.zeros(pool.size, dtype=np.int64)
+        for code in range(len(POSITIONS)):
+            indices = np.flatnonzero(position == code)
+            indices = indices[np.argsort(pool.adp_rank[indices], kind="stable")]
+            position_rank[indices] = np.arange(len(indices))
+            self.by_position.append(indices)
+        self.position_sizes = np.array([len(indices) for indices in self.by_position])
+        self.adp_order = np.concatenate(self.by_position)
+        self.offsets = np.cumsum(self.position_sizes) - self.position_sizes
+
+        self.tier = np.searchsorted(TIER_EDGES, position_rank, side="right")
+        self.quality = (position_rank < QUALITY_DEPTH[pool.position]).astype(np.int64)
+
+        self.initial_tiers = np.zeros((len(POSITIONS), NUM_TIERS), dtype=np.int64)
+        self.initial_tier_fpts = np.zeros((len(POSITIONS), NUM_TIERS))
+        np.add.at(self.initial_tiers, (position, self.tier[:num_players]), 1)
+        np.add.at(self.initial_tier_fpts, (position, self.tier[:num_players]), pool.fpts[:num_players])
+        self.initial_quality = np.minimum(self.position_sizes, QUALITY_DEPTH)
+
+        self.tier_counts = np.tile(self.initial_tiers, (num_drafts, 1, 1))
+        self.tier_fpts = np.tile(self.initial_tier_fpts, (num_drafts, 1, 1))
+        self.quality_counts = np.tile(self.initial_quality, (num_drafts, 1))
+        self.cursors = np.zeros((num_drafts, len(POSITIONS)), dtype=np.int64)
+
+    def reset(self, rows=slice(None)):
+        self.tier_counts[rows] = self.initial_tiers
+        self.tier_fpts[rows] = self.initial_tier_fpts
+        self.quality_counts[rows] = self.initial_quality
+        self.cursors[rows] = 0
+
+    def record(self, rows, indices):
+        """Account for players ``indices`` drafted in draft ``rows``."""
+        rows = np.asarray(rows)
+        indices = np.asarray(indices)
+        position = self.pool.position[indices]
+        tier = self.tier[indices]
+        np.subtract.at(self.tier_counts, (rows, position, tier), 1)
+        np.subtract.at(self.tier_fpts, (rows, position, tier), self.pool.fpts[indices])
+        np.subtract.at(self.quality_counts, (rows, position), self.quality[indices])
+
+    def record_pick(self, row, index):
+        """``record`` for a single pick, without the fancy-indexing overhead."""
+        code = self.pool.position[index]
+        tier = self.tier[index]
+        self.tier_counts[row, code, tier] -= 1
+        self.tier_fpts[row, code, tier] -= self.pool.fpts[index]
+        self.quality_counts[row, code] -= self.quality[index]
+
+    def remaining(self) -> np.ndarray:
+        """Players left per (draft, position)."""
+        return self.tier_counts.sum(axis=2)
+
+    def taken(self) -> np.ndarray:
+        """Players drafted per (draft, position)."""
+        return self.position_sizes - self.remaining()
+
+    def scarcity(self) -> np.ndarray:
+        """Remaining quality players over remaining players, per (draft, position)."""
+        return self.quality_counts / np.maximum(self.remaining(), 1)
+
+    def tier_depth(self) -> np.ndarray:
+        """Share of each ADP tier still on the board, per (draft, position, tier)."""
+        return self.tier_counts / np.maximum(self.initial_tiers, 1)
+
+    def current_tier(self) -> np.ndarray:
+        """Best tier with players left, per (draft, position); NUM_TIERS when empty."""
+        occupied = self.tier_counts > 0
+        return np.where(occupied.any(axis=2), occupied.argmax(axis=2), NUM_TIERS)
+
+    def dropoff(self) -> np.ndarray:
+        """Mean fpts of the best remaining tier minus that of the next one, per (draft, position).
+
+        Zero when fewer than two tiers have players left.
+        """
+        occupied = (self.tier_counts > 0).reshape(-1, NUM_TIERS)
+        means = (self.tier_fpts / np.maximum(self.tier_counts, 1)).reshape(-1, NUM_TIERS)
+        first = occupied.argmax(axis=1)
+        rest = occupied & (np.arange(NUM_TIERS) > first[:, None])
+        second = rest.argmax(axis=1)
+        cells = np.arange(len(means))
+        drop = np.where(rest.any(axis=1), means[cells, first] - means[cells, second], 0.0)
+        return drop.reshape(self.tier_counts.shape[:2])
+
+    def best_available(self, available, rows, codes) -> np.ndarray:
+        """Best-ADP available player at position ``codes[i]`` in draft ``rows[i]`` (-1 if none).
+
+        Per-(draft, position) cursors skip drafted players, so repeated
+        lookups cost O(1) amortised.
+        """
+        rows = np.asarray(rows)
+        codes = np.asarray(codes)
+        best = np.full(len(rows), -1, dtype=np.int64)
+        pending = np.arange(len(rows))
+        while len(pending):
+            row, code = rows[pending], codes[pending]
+            cursor = self.cursors[row, code]
+            in_list = cursor < self.position_sizes[code]
+            index = self.adp_order[np.where(in_list, self.offsets[code] + cursor, 0)]
+            free = in_list & available[row, index]
+            best[pending[free]] = index[free]
+            skip = in_list & ~free
+            self.cursors[row[skip], code[skip]] += 1
+            pending = pending[skip]
+        return best
+
+    def sample_positions(self, rng, rows) -> np.ndarray:
+        """Draw a position per draft row, weighted by quality players left (any players once quality runs out)."""
+        weights = self.quality_counts[rows].astype(np.float64)
+        exhausted = weights.sum(axis=1) == 0
+        weights[exhausted] = self.remaining()[rows][exhausted]
+        cumulative = np.cumsum(weights, axis=1)
+        draws = rng.random(len(weights)) * cumulative[:, -1]
+        return (cumulative <= draws[:, None]).sum(axis=1)
+
+    def scarcity_pick(self, rng, row, available) -> int:
+        """One bot pick for a single draft: ``sample_positions`` then ``best_available``.
+
+        ``available`` is that draft's 1-D availability mask.
+        """
+        weights = self.quality_counts[row]
+        if not weights.any():
+            weights = self.tier_counts[row].sum(axis=1)
+        cumulative = np.cumsum(weights)
+        code = int(np.searchsorted(cumulative, rng.random() * cumulative[-1], side="right"))
+        indices = self.by_position[code]
+        cursor = self.cursors[row, code]
+        while not available[indices[cursor]]:
+            cursor += 1
+        self.cursors[row, code] = cursor
+        return int(indices[cursor])
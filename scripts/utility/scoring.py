@@ -0,0 +1,107 @@
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from utility.constants import DEFENSIVE_STATS_DIR, SEASONAL_STATS_DIR
+from utility.data_store import read_table
+
+# Offensive formats: points per unit of each player_stats column (missing stats score 0)
+PPR = {
+    "passing_yards": 0.04, "pass_touchdown": 4, "interception": -2,
+    "rushing_yards": 0.1, "rush_touchdown": 6,
+    "receiving_yards": 0.1, "receptions": 1, "rec_touchdown": 6,
+    "pat_made": 1,
+    "fg_made_0-39": 3, "fg_made_40-49": 4, "fg_made_50-59": 5, "fg_made_60+": 6,
+    "fg_missed_0-39": -1, "fg_missed_40-49": -1, "fg_missed_50-59": -1, "fg_missed_60+": -1,
+    "kick_return_touchdown": 6, "punt_return_touchdown": 6,
+    "fumble_lost": -2,
+    "two_point_pass_success": 2, "two_point_rush_success": 2, "two_point_rec_success": 2,
+}
+HALF_PPR = {**PPR, "receptions": 0.5}
+STANDARD = {**PPR, "receptions": 0}
+OFFENSE_FORMATS = {"fppr": PPR, "hppr": HALF_PPR}
+
+# DST buckets, as in the weekly defensive stats: right-closed bins and their labels
+YA_BINS = [0, 99, 199, 299, 349, 399, 449, 499, 549, float("inf")]
+YA_LABELS = ["YA100", "YA199", "YA299", "YA349", "YA399", "YA449", "YA499", "YA549", "YA550"]
+PA_BINS = [-0.01, 0.99, 6.99, 13.99, 17.99, 27.99, 34.99, 45.99, float("inf")]
+PA_LABELS = ["PA0", "PA1", "PA7", "PA14", "PA18", "PA28", "PA35", "PA46"]
+
+# DST formats: per-stat weights plus points per yards-allowed and points-allowed bucket
+DST_SCORING = {
+    "weights": {"d_td": 6, "sk": 1, "pbk": 2, "blkk": 2, "int": 2, "fr": 2, "sfty": 2},
+    "ya_points": [5, 3, 2, 0, -1, -3, -5, -6, -7],
+    "pa_points": [5, 4, 3, 1, 0, -1, -3, -5],
+}
+DST_FORMATS = {"fpts": DST_SCORING}
+
+
+def weight_matrix(formats: Dict[str, dict], columns) -> np.ndarray:
+    """(columns x formats) weights; stats a format does not list weigh 0."""
+    weights = np.zeros((len(columns), len(formats)))
+    index = {column: i for i, column in enumerate(columns)}
+    for j, weights_by_stat in enumerate(formats.values()):
+        for stat, weight in weights_by_stat.items():
+            if stat in index:
+                weights[index[stat], j] = weight
+    return weights
+
+
+def stats_matrix(stats_df, columns) -> np.ndarray:
+    """``columns`` of ``stats_df`` as a float matrix; absent columns are zeros."""
+    return stats_df.reindex(columns=columns, fill_value=0).to_numpy(dtype=np.float64)
+
+
+def score(stats_df, formats: Dict[str, dict] = OFFENSE_FORMATS) -> pd.DataFrame:
+    """Points under every format at once: one stats x weights product.
+
+    Returns a frame with one column per format name, aligned to stats_df.
+    """
+    columns = sorted({stat for weights_by_stat in formats.values() for stat in weights_by_stat})
+    points = stats_matrix(stats_df, columns) @ weight_matrix(formats, columns)
+    return pd.DataFrame(points, columns=list(formats), index=stats_df.index)
+
+
+def bucket_codes(values, bins) -> np.ndarray:
+    """Right-closed bucket of each value (-1 outside the bins), like pd.cut codes."""
+    return pd.cut(values, bins=bins, labels=False, right=True).fillna(-1).to_numpy(dtype=np.int64)
+
+
+def bucket_indicators(values, bins, labels) -> pd.DataFrame:
+    """One 0/1 column per bucket label."""
+    codes = bucket_codes(values, bins)
+    return pd.DataFrame((codes[:, None] == np.arange(len(labels))).astype(int), columns=labels,
+                        index=getattr(values, "index", None))
+
+
+def _bucket_points(codes, tables) -> np.ndarray:
+    """(rows x formats) points looked up from each format's bucket table; 0 outside the bins."""
+    tables = np.column_stack([np.append(np.asarray(table, dtype=np.float64), 0.0) for table in tables])
+    return tables[codes]
+
+
+def score_dst(weekly_df, formats: Dict[str, dict] = DST_FORMATS) -> pd.DataFrame:
+    """Weekly DST points under every format from the raw ``ya`` and ``pa`` totals.
+
+    Bucket scoring is a table lookup on each week's bucket code, so formats
+    with their own bucket points need no extra indicator columns.
+    """
+    points = score(weekly_df, {name: fmt["weights"] for name, fmt in formats.items()}).to_numpy()
+    points += _bucket_points(bucket_codes(weekly_df["ya"], YA_BINS), [fmt["ya_points"] for fmt in formats.values()])
+    points += _bucket_points(bucket_codes(weekly_df["pa"], PA_BINS), [fmt["pa_points"] for fmt in formats.values()])
+    return pd.DataFrame(points, columns=list(formats), index=weekly_df.index)
+
+
+def season_scores(year, formats: Dict[str, dict] = OFFENSE_FORMATS) -> pd.DataFrame:
+    """Rescore a season's player_stats CSV under custom formats, without rerunning the scraper."""
+    stats_df = read_table(Path(SEASONAL_STATS_DIR) / f"player_stats_{year}.csv")
+    return pd.concat([stats_df[["player_id", "position"]], score(stats_df, formats)], axis=1)
+
+
+def season_dst_scores(year, formats: Dict[str, dict] = DST_FORMATS) -> pd.DataFrame:
+    """Season DST points per team under custom formats, summed from the weekly defensive stats CSV."""
+    weekly_df = read_table(Path(DEFENSIVE_STATS_DIR) / f"weekly_defensive_stats_{year}.csv")
+    points = pd.concat([weekly_df[["season", "pa_team"]], score_dst(weekly_df, formats)], axis=1)
+    return points.groupby(["season", "pa_team"], as_index=False).sum()
@@ -0,0 +1,175 @@
+import numpy as np
+import pandas as pd
+
+from utility.constants import (
+    H2H_REGULAR_WEEKS,
+    PLAYOFF_TEAMS,
+    POSITION_CODES,
+    POSITIONS,
+    SEASON_BATCH_SIZE,
+    STARTER_POSITIONS,
+)
+from utility.lineup_scoring import FLEX_EXCLUDED
+from utility.player_ids import load_registry
+from utility.profiler import phase
+from utility.weekly_stats import load_weekly_points
+
+FLEX_CODES = [POSITION_CODES[pos] for pos in POSITIONS if pos not in FLEX_EXCLUDED]
+
+
+def round_robin(num_teams, num_weeks) -> np.ndarray:
+    """(weeks x teams) opponent of each schedule slot, by the circle method, repeated as needed."""
+    if num_teams % 2:
+        raise ValueError("Head-to-head schedules need an even number of teams.")
+    slots = np.arange(num_teams)
+    rounds = []
+    for _ in range(num_teams - 1):
+        opponents = np.empty(num_teams, dtype=np.int64)
+        opponents[slots] = slots[::-1]
+        rounds.append(opponents)
+        slots = np.concatenate([[slots[0]], np.roll(slots[1:], 1)])
+    return np.array([rounds[week % len(rounds)] for week in range(num_weeks)])
+
+
+def bracket_order(num_teams) -> np.ndarray:
+    """Seeds in bracket order (1v8, 4v5, 2v7, 3v6 for eight), so top seeds meet last."""
+    if num_teams & (num_teams - 1):
+        raise ValueError("PLAYOFF_TEAMS must be a power of two.")
+    order = np.array([0])
+    while len(order) < num_teams:
+        order = np.column_stack([order, 2 * len(order) - 1 - order]).ravel()
+    return order
+
+
+def weekly_lineup_points(player_points, positions) -> np.ndarray:
+    """Points of each team's optimal weekly lineup: starters per position plus one flex.
+
+    ``player_points`` is (leagues x teams x roster x weeks) and ``positions``
+    (leagues x teams x roster) holds position codes, -1 for empty roster spots.
+    Returns (leagues x teams x weeks).
+    """
+    total = np.zeros(player_points.shape[:2] + player_points.shape[3:], dtype=np.float64)
+    flex = np.full_like(total, -np.inf)
+    for code, pos in enumerate(POSITIONS):
+        # Best first within the position; other positions sink to the bottom as -inf
+        ranked = -np.sort(np.where((positions == code)[..., None], -player_points, np.inf), axis=2)
+        starters = STARTER_POSITIONS[pos]
+        best = ranked[:, :, :starters]
+        total += np.where(np.isfinite(best), best, 0.0).sum(axis=2)
+        if code in FLEX_CODES and ranked.shape[2] > starters:
+            flex = np.maximum(flex, ranked[:, :, starters])
+    return total + np.where(np.isfinite(flex), flex, 0.0)
+
+
+def _rosters(draft_results_df):
+    """Dense (leagues x teams x roster) player codes and position codes of each drafted team."""
+    df = draft_results_df.reset_index(drop=True)
+    trial_codes, trials = pd.factorize(df["trial_number"], sort=True)
+    team_codes, teams = pd.factorize(df["team_name"], sort=True)
+    order = np.lexsort((df.index.to_numpy(), team_codes, trial_codes))
+    trial_codes, team_codes = trial_codes[order], team_codes[order]
+    # Roster spot: order of the pick within its team
+    team_keys = pd.Series(trial_codes * len(teams) + team_codes)
+    slot = team_keys.groupby(team_keys).cumcount().to_numpy()
+
+    shape = (len(trials), len(teams), slot.max() + 1)
+    players = np.full(shape, -1, dtype=np.int64)
+    positions = np.full(shape, -1, dtype=np.int64)
+    if "player_code" in df.columns:
+        codes = df["player_code"].to_numpy(dtype=np.int64)
+    else:
+        codes = load_registry().encode(df["player_id"]).astype(np.int64)
+    players[trial_codes, team_codes, slot] = codes[order]
+    positions[trial_codes, team_codes, slot] = df["position"].map(POSITION_CODES).fillna(-1).to_numpy(dtype=np.int64)[order]
+    return trials.to_numpy(), teams.to_numpy(), players, positions
+
+
+def play_season(scores, rng, regular_weeks=H2H_REGULAR_WEEKS, playoff_teams=PLAYOFF_TEAMS):
+    """Play the regular season and playoffs of every league from its (leagues x teams x weeks) scores.
+
+    Each league gets its own random assignment of teams to schedule slots.
+    Teams are seeded by wins, then points for; playoff games are decided by
+    that week's score, ties going to the better seed. Returns a dict of
+    (leagues x teams) arrays.
+    """
+    num_leagues, num_teams, num_weeks = scores.shape
+    playoff_rounds = int(np.log2(playoff_teams))
+    if regular_weeks + playoff_rounds > num_weeks:
+        raise ValueError(f"{regular_weeks} regular-season and {playoff_rounds} playoff weeks "
+                         f"need more than the {num_weeks} weeks of stats available.")
+    leagues = np.arange(num_leagues)[:, None]
+
+    # Regular season: slot_team[l, s] is the team in schedule slot s of league l
+    slot_team = rng.permuted(np.tile(np.arange(num_teams), (num_leagues, 1)), axis=1)
+    team_slot = np.argsort(slot_team, axis=1)
+    schedule = round_robin(num_teams, regular_weeks)
+    opponents = slot_team[leagues[:, :, None], schedule.T[team_slot]]
+    points_for = scores[:, :, :regular_weeks]
+    points_against = np.take_along_axis(points_for, opponents, axis=1)
+    wins = (points_for > points_against).sum(axis=2)
+    ties = (points_for == points_against).sum(axis=2)
+
+    # Seeds: most wins (ties count half), then most points
+    total_for = points_for.sum(axis=2)
+    seeded = np.lexsort((-total_for, -(wins + 0.5 * ties)), axis=1)
+    seed = np.empty_like(seeded)
+    np.put_along_axis(seed, seeded, np.arange(num_teams)[None, :], axis=1)
+
+    # Playoffs: winners of each pair stay in bracket order; losers of a round share its finish band
+    finish = seed + 1
+    alive = seeded[:, bracket_order(playoff_teams)]
+    for round_num in range(playoff_rounds):
+        week = regular_weeks + round_num
+        home, away = alive[:, 0::2], alive[:, 1::2]
+        home_score, away_score = scores[leagues, home, week], scores[leagues, away, week]
+        home_wins = (home_score > away_score) | ((home_score == away_score) & (seed[leagues, home] < seed[leagues, away]))
+        winners = np.where(home_wins, home, away)
+        losers = np.where(home_wins, away, home)
+        # Losers are placed behind the survivors, better seeds first
+        loser_order = np.argsort(seed[leagues, losers], axis=1)
+        finish[leagues, np.take_along_axis(losers, loser_order, axis=1)] = winners.shape[1] + 1 + np.arange(losers.shape[1])
+        alive = winners
+    finish[leagues, alive] = 1
+
+    return {
+        "wins": wins,
+        "losses": regular_weeks - wins - ties,
+        "ties": ties,
+        "points_for": total_for,
+        "points_against": points_against.sum(axis=2),
+        "seed": seed + 1,
+        "finish": finish,
+    }
+
+
+def simulate_seasons(draft_results_df, fmt="fppr", seed=None, regular_weeks=H2H_REGULAR_WEEKS,
+                     playoff_teams=PLAYOFF_TEAMS, batch_size=SEASON_BATCH_SIZE) -> pd.DataFrame:
+    """Play every drafted league's head-to-head season on its year's weekly points.
+
+    Leagues of a season are simulated together in batches of ``batch_size``:
+    weekly optimal lineups, a shuffled round-robin schedule and playoffs are
+    all array operations over (leagues x teams x weeks). Returns one row per
+    team with its record, points, seed and final finish (1 = champion).
+    """
+    rng = np.random.default_rng(seed)
+    frames = []
+    for year, year_df in draft_results_df.groupby("year", sort=True):
+        with phase("weekly_load"):
+            weekly = load_weekly_points(year, fmt)
+        trial_numbers = np.sort(year_df["trial_number"].unique())
+        for start in range(0, len(trial_numbers), batch_size):
+            batch_df = year_df[year_df["trial_number"].isin(trial_numbers[start:start + batch_size])]
+            trials, teams, players, positions = _rosters(batch_df)
+            with phase("weekly_lineups"):
+                scores = weekly_lineup_points(weekly.points[players], positions)
+            with phase("play_season"):
+                season = play_season(scores, rng, regular_weeks, playoff_teams)
+            frame = pd.DataFrame({
+                "year": year,
+                "trial_number": np.repeat(trials, len(teams)),
+                "team_name": np.tile(teams, len(trials)),
+            })
+            for column, values in season.items():
+                frame[column] = values.ravel()
+            frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
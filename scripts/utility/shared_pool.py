@@ -0,0 +1,63 @@
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable
+
+import numpy as np
+
+from utility.constants import CACHE_DIR
+from utility.draft_env import POOL_ARRAYS, DraftPool
+
+SHARED_POOL_DIR = Path(CACHE_DIR) / "shared_pools"
+
+
+def _save_array(path: Path, array):
+    # Write then rename so a worker never maps a half-written file
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp.npy")
+    np.save(tmp_path, array)
+    os.replace(tmp_path, path)
+
+
+def _pad(array: np.ndarray, padding) -> np.ndarray:
+    # Padding rows are never available; -1 and "" keep them from reading as player 0
+    if array.dtype.kind in "US":
+        fill = ""
+    elif array.dtype.kind == "i":
+        fill = -1
+    else:
+        fill = 0
+    return np.pad(array, (0, padding), constant_values=fill)
+
+
+def publish_pools(years: Iterable[int], directory: Path = SHARED_POOL_DIR) -> Dict[int, Path]:
+    """Write each season's DraftPool arrays once as .npy files for workers to map.
+
+    Pools are padded to the largest season so every worker shares one action
+    space. Names and ids are stored as fixed-width strings so the files can be
+    memory-mapped; the OS page cache then holds a single copy for all workers.
+    """
+    pools = [DraftPool(year) for year in sorted(set(int(year) for year in years))]
+    size = max(pool.size for pool in pools)
+    published = {}
+    for pool in pools:
+        path = Path(directory) / str(pool.year)
+        os.makedirs(path, exist_ok=True)
+        padding = size - pool.num_players
+        for name in POOL_ARRAYS:
+            array = getattr(pool, name)
+            if array.dtype == object:
+                array = array.astype(str)
+            _save_array(path / f"{name}.npy", _pad(array, padding))
+        with open(path / "pool.json", "w") as f:
+            json.dump({"year": pool.year, "num_players": pool.num_players}, f)
+        published[pool.year] = path
+    return published
+
+
+def attach_pool(path: Path) -> DraftPool:
+    """Map a published pool read-only; no CSVs are read and nothing is copied."""
+    path = Path(path)
+    with open(path / "pool.json") as f:
+        meta = json.load(f)
+    arrays = {name: np.load(path / f"{name}.npy", mmap_mode="r") for name in POOL_ARRAYS}
+    return DraftPool.from_arrays(meta["year"], num_players=meta["num_players"], **arrays)
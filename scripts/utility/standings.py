@@ -0,0 +1,108 @@
+import heapq
+import math
+from typing import Dict, List
+
+from utility.constants import NUM_MANAGERS, POSITIONS, STARTER_POSITIONS
+from utility.lineup_scoring import FLEX_EXCLUDED, LINEUP_SLOTS, STARTER_SLOTS, WAIVER_SLOTS, typed_waiver_points
+
+FLEX_POSITIONS = [pos for pos in POSITIONS if pos not in FLEX_EXCLUDED]
+
+# Players kept per position: the starters, plus the best bench player at
+# flex-eligible positions
+KEEP = {pos: STARTER_POSITIONS[pos] + (pos in FLEX_POSITIONS) for pos in POSITIONS}
+
+
+def average_rank(totals: List[float]) -> List[int]:
+    """Descending average rank truncated to int, like groupby rank().astype(int)."""
+    ranks = []
+    for total in totals:
+        greater = sum(other > total for other in totals)
+        equal = sum(other == total for other in totals)
+        ranks.append(int(greater + (equal + 1) / 2))
+    return ranks
+
+
+class TeamLineup:
+    """A team's best players per position, kept as small min-heaps.
+
+    Entries order by fpts (NaN below everything) and then by earlier pick,
+    the same order the ranking stage sorts a team by, so each pick is an
+    O(1) heap update and the lineup always equals the full re-ranking.
+    """
+
+    def __init__(self):
+        self.best = {pos: [] for pos in POSITIONS}
+
+    def add(self, position, fpts, player_name, pick):
+        missing = fpts is None or math.isnan(fpts)
+        entry = (-math.inf if missing else fpts, -pick, 0.0 if missing else fpts, player_name)
+        heap = self.best[position]
+        if len(heap) < KEEP[position]:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+
+    def slots(self) -> Dict[str, tuple]:
+        """(player_name, fpts) per lineup slot; empty slots are (None, 0)."""
+        ordered = {pos: sorted(heap, reverse=True) for pos, heap in self.best.items()}
+        lineup = {}
+        for slot, position, rank in STARTER_SLOTS:
+            players = ordered[position]
+            lineup[slot] = (players[rank][3], players[rank][2]) if rank < len(players) else (None, 0)
+
+        # Flex: best non-starter at a flex-eligible position
+        bench = [ordered[pos][STARTER_POSITIONS[pos]] for pos in FLEX_POSITIONS
+                 if len(ordered[pos]) > STARTER_POSITIONS[pos]]
+        flex = max(bench) if bench else None
+        lineup["Flex1"] = (flex[3], flex[2]) if flex else (None, 0)
+        return lineup
+
+    def total(self) -> float:
+        return sum(fpts for _, fpts in self.slots().values())
+
+
+class DraftStandings:
+    """Live standings of one draft, updated pick by pick."""
+
+    def __init__(self, trial_number, year):
+        self.trial_number = trial_number
+        self.year = year
+        self.lineups = {manager: TeamLineup() for manager in range(1, NUM_MANAGERS + 1)}
+        self.round_standings = []
+
+    def record_pick(self, manager, position, fpts, player_name, pick):
+        self.lineups[manager].add(position, fpts, player_name, pick)
+
+    def close_round(self, round_num):
+        """Rank teams on their current lineup (no waiver floors yet)."""
+        managers = list(self.lineups)
+        totals = [self.lineups[manager].total() for manager in managers]
+        for manager, total, rank in zip(managers, totals, average_rank(totals)):
+            self.round_standings.append({
+                "trial_number": self.trial_number,
+                "round": round_num,
+                "team_name": f"Team_{manager}",
+                "total_fpts": total,
+                "current_rank": rank,
+            })
+
+    def final_ranking(self, waiver_points) -> List[Dict]:
+        """Waiver-adjusted lineups in the fantasy_ranking layout, applied after the last round."""
+        waiver_points = typed_waiver_points(waiver_points)
+        rows = []
+        for manager in sorted(self.lineups, key=lambda manager: f"Team_{manager}"):
+            lineup = self.lineups[manager].slots()
+            for slot, column, replacement in WAIVER_SLOTS:
+                if waiver_points[column] > lineup[slot][1]:
+                    lineup[slot] = (replacement, waiver_points[column])
+
+            row = {"year": self.year, "trial_number": self.trial_number, "team_name": f"Team_{manager}"}
+            for slot in LINEUP_SLOTS:
+                row[slot], row[f"{slot}_fpts"] = lineup[slot]
+            row.update(waiver_points)
+            row["total_fpts"] = sum(row[f"{slot}_fpts"] for slot in LINEUP_SLOTS)
+            rows.append(row)
+
+        for row, rank in zip(rows, average_rank([row["total_fpts"] for row in rows])):
+            row["rank"] = rank
+        return rows
@@ -0,0 +1,67 @@
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from utility.constants import DEFENSIVE_STATS_DIR, SEASONAL_STATS_DIR
+from utility.data_store import read_table
+from utility.player_ids import load_registry
+
+# Weekly points already built in this process, keyed by (year, format)
+_weekly: Dict[tuple, "WeeklyPoints"] = {}
+
+
+class WeeklyPoints:
+    """A season's fantasy points as a dense (player code x week) matrix.
+
+    Row ``i`` holds the player or DST team with registry code ``i`` and
+    column ``j`` week ``weeks[j]``; weeks a player has no stats score 0.
+    An extra all-zero last row stands in for unknown players, so a lookup
+    of code -1 scores nothing.
+    """
+
+    def __init__(self, year, weeks, points):
+        self.year = year
+        self.weeks = np.asarray(weeks)
+        self.points = points
+
+    @property
+    def num_weeks(self) -> int:
+        return len(self.weeks)
+
+
+def weekly_sources(year) -> List[Path]:
+    """Weekly offensive and defensive stats files a season's points come from."""
+    return [
+        Path(SEASONAL_STATS_DIR) / f"weekly_player_stats_{year}.csv",
+        Path(DEFENSIVE_STATS_DIR) / f"weekly_defensive_stats_{year}.csv",
+    ]
+
+
+def has_weekly_stats(year) -> bool:
+    return all(path.exists() for path in weekly_sources(year))
+
+
+def build_weekly_points(year, fmt="fppr") -> WeeklyPoints:
+    """Scatter the weekly stats tables into a WeeklyPoints matrix; DST uses its fpts column."""
+    offense_file, defense_file = weekly_sources(year)
+    offense_df = read_table(offense_file, columns=["player_id", "week", fmt])
+    defense_df = read_table(defense_file, columns=["pa_team", "week", "fpts"])
+    registry = load_registry()
+    codes = np.concatenate([registry.encode(offense_df["player_id"]), registry.encode(defense_df["pa_team"])])
+    week_values = np.concatenate([offense_df["week"].to_numpy(), defense_df["week"].to_numpy()])
+    fpts = np.concatenate([offense_df[fmt].to_numpy(dtype=np.float64), defense_df["fpts"].to_numpy(dtype=np.float64)])
+
+    weeks = np.arange(1, week_values.max() + 1)
+    points = np.zeros((len(registry) + 1, len(weeks)), dtype=np.float32)
+    known = codes >= 0
+    np.add.at(points, (codes[known], week_values[known] - 1), np.nan_to_num(fpts[known]))
+    return WeeklyPoints(year, weeks, points)
+
+
+def load_weekly_points(year, fmt="fppr") -> WeeklyPoints:
+    """Weekly points for a season, built once per process from the data store."""
+    key = (int(year), fmt)
+    if key not in _weekly:
+        _weekly[key] = build_weekly_points(*key)
+    return _weekly[key]